@@ -1,8 +1,21 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from difflib import SequenceMatcher
-from typing import Any, Dict, List, Optional, Tuple
+from threading import RLock, local
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-import requests
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import requests
+
+try:  # RapidFuzz scores candidates in C; difflib remains the fallback.
+    from rapidfuzz import fuzz, process
+except ImportError:  # pragma: no cover - optional accelerator
+    fuzz = process = None
+
+try:  # orjson decodes large search payloads several times faster than json.
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional accelerator
+    from json import loads as _json_loads
 
 
 DEFAULT_COLUMNS = [
@@ -27,6 +40,8 @@ DEFAULT_API_FIELDS = [
     "edition_count",
     "cover_i",
     "isbn",
+    # The Search API cannot cap this array server-side; it is the bulk of each
+    # page, and consumers slice it themselves (see build_record).
     "subject",
     "publisher",
     "number_of_pages_median",
@@ -35,6 +50,46 @@ DEFAULT_API_FIELDS = [
 
 COVER_URL_TEMPLATE = "https://covers.openlibrary.org/b/id/{cover_id}-L.jpg"
 PAGE_SIZE = 10
+# Open Library can return hundreds of subject tags per work; nothing shows or
+# stores more than this many.
+MAX_SUBJECTS = 6
+MAX_CONCURRENT_FETCHES = 4
+# Fuzzy matches below this similarity are treated as no match at all.
+MIN_MATCH_RATIO = 0.2
+USER_AGENT = "book-keeper (personal library catalogue)"
+def prepare_session(session: "requests.Session") -> "requests.Session":
+    """Give ``session`` the shared User-Agent and keep-alive pools."""
+    from requests.adapters import HTTPAdapter
+
+    session.headers["User-Agent"] = USER_AGENT
+    # One pool per host the session talks to.
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _build_session() -> "requests.Session":
+    """Create a pooled, keep-alive session."""
+    import requests
+
+    return prepare_session(requests.Session())
+
+
+# Built on first use: the inventory store imports this module only for its
+# constants and should not pay for importing the HTTP stack.
+_SESSION: Optional["requests.Session"] = None
+_session_lock = RLock()
+
+
+def get_session() -> "requests.Session":
+    """Return the shared HTTP session (one keep-alive connection pool per host)."""
+    global _SESSION
+    if _SESSION is None:
+        with _session_lock:
+            if _SESSION is None:
+                _SESSION = _build_session()
+    return _SESSION
 
 
 @dataclass
@@ -63,88 +118,240 @@ class OpenLibraryQuery:
             params["fields"] = ",".join(self.fields)
         return params
 
+    def cache_key(self, offset: int = 0) -> "SearchCacheKey":
+        """Hashable identity of the request this query issues at ``offset``."""
+        return tuple(sorted(self.to_params().items())) + (("offset", str(offset)),)
+
+
+SearchCacheKey = Tuple[Tuple[str, str], ...]
+
+# Page revisits are memoized in process; searches never go through the
+# enrichment module's optional on-disk HTTP cache.
+_SEARCH_CACHE_CAPACITY = 128
+_search_cache: "OrderedDict[SearchCacheKey, Tuple[List[Dict[str, Any]], int]]" = OrderedDict()
+_search_cache_lock = RLock()
+
 
 def fetch_records(query: OpenLibraryQuery, offset: int = 0) -> Tuple[List[Dict[str, Any]], int]:
     """Fetch matching records from the Open Library Search API."""
+    cache_key = query.cache_key(offset)
+    with _search_cache_lock:
+        cached = _search_cache.get(cache_key)
+        if cached is not None:
+            _search_cache.move_to_end(cache_key)
+            ranked, total = cached
+            # Hand out copies so callers cannot mutate the cached docs.
+            return [dict(doc) for doc in ranked], total
+
+    result = _fetch_uncached(query, offset)
+    if result is None:
+        return [], 0
+
+    ranked, total = result
+    with _search_cache_lock:
+        _search_cache[cache_key] = result
+        if len(_search_cache) > _SEARCH_CACHE_CAPACITY:
+            _search_cache.popitem(last=False)
+    return [dict(doc) for doc in ranked], total
+
+
+def is_search_cached(query: OpenLibraryQuery, offset: int = 0) -> bool:
+    """True when fetch_records would answer this page from the memo."""
+    with _search_cache_lock:
+        return query.cache_key(offset) in _search_cache
+
+
+def _fetch_uncached(
+    query: OpenLibraryQuery, offset: int
+) -> Optional[Tuple[List[Dict[str, Any]], int]]:
+    import requests
+
     params = query.to_params()
     if offset:
         params["offset"] = str(offset)
     try:
-        response = requests.get(
+        with get_session().get(
             "https://openlibrary.org/search.json",
             params=params,
             timeout=15,
-        )
-        response.raise_for_status()
-        data = response.json()
+        ) as response:
+            response.raise_for_status()
+            data = _json_loads(response.content)
     except requests.RequestException as error:  # pragma: no cover - defensive guard
         print(f"Unable to reach Open Library: {error}")
-        return [], 0
+        return None
+    except ValueError as error:  # pragma: no cover - defensive guard
+        print(f"Unexpected response from Open Library: {error}")
+        return None
 
     docs = data.get("docs", []) if isinstance(data, dict) else []
     ranked = rank_docs(query, docs or [])
-    return ranked, data.get("num_found", len(ranked))
+    total = data.get("num_found", len(ranked)) if isinstance(data, dict) else len(ranked)
+    return ranked, total
+
+
+def fetch_pages(
+    query: OpenLibraryQuery, offsets: List[int]
+) -> List[Tuple[List[Dict[str, Any]], int]]:
+    """Fetch several result pages concurrently, in the order of ``offsets``."""
+    if len(offsets) <= 1:
+        return [fetch_records(query, offset=offset) for offset in offsets]
+    workers = min(len(offsets), MAX_CONCURRENT_FETCHES)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(lambda offset: fetch_records(query, offset=offset), offsets))
+
+
+# difflib is only needed when RapidFuzz is unavailable, so it is imported on
+# first use. Matchers are per thread because fetch_pages ranks concurrently.
+_matcher_state = local()
+
+
+def _difflib_matcher(target: str) -> Any:
+    """Return this thread's matcher for ``target``, indexed as seq2.
+
+    The query side stays constant across a ranking pass and across the pages
+    of one search, so its index is built once and only candidates are swapped
+    in with ``set_seq1``.
+    """
+    matchers: Optional[Dict[str, Any]] = getattr(_matcher_state, "matchers", None)
+    if matchers is None:
+        matchers = _matcher_state.matchers = {}
+    matcher = matchers.get(target)
+    if matcher is None:
+        from difflib import SequenceMatcher
+
+        if len(matchers) >= 8:
+            matchers.clear()
+        matcher = matchers[target] = SequenceMatcher(None, autojunk=False)
+        matcher.set_seq2(target)
+    return matcher
+
+
+def _similarities(target: str, candidates: List[str]) -> List[float]:
+    """Score each candidate against ``target`` on a 0-1 scale.
+
+    Scores below ``MIN_MATCH_RATIO`` are reported as 0.0.
+    """
+    if not target or not candidates:
+        return [0.0] * len(candidates)
+
+    if process is not None:
+        results = [0.0] * len(candidates)
+        matches = process.extract(
+            target,
+            candidates,
+            scorer=fuzz.ratio,
+            score_cutoff=MIN_MATCH_RATIO * 100,
+            limit=None,
+        )
+        for _choice, score, index in matches:
+            results[index] = score / 100.0
+        return results
+
+    matcher = _difflib_matcher(target)
+    results = []
+    for candidate in candidates:
+        matcher.set_seq1(candidate)
+        # Both quick ratios are upper bounds on ratio(); skip the full match
+        # when even the optimistic estimate cannot clear the threshold.
+        if (
+            matcher.real_quick_ratio() < MIN_MATCH_RATIO
+            or matcher.quick_ratio() < MIN_MATCH_RATIO
+        ):
+            results.append(0.0)
+        else:
+            results.append(matcher.ratio())
+    return results
+
+
+def _year_bonus(target_year: Optional[int], value: Any) -> float:
+    """Reward docs first published close to the requested year."""
+    if not target_year or not value:
+        return 0.0
+    try:
+        year_value = int(value)
+    except (TypeError, ValueError):
+        return 0.0
+    difference = abs(target_year - year_value)
+    if difference == 0:
+        return 2.0
+    return max(0.0, 1.0 - min(difference, 50) / 50.0)
+
+
+def _edition_bonus(edition_count: Any) -> float:
+    """Give widely reprinted works a small nudge."""
+    if isinstance(edition_count, int):
+        return min(edition_count, 5) * 0.1
+    return 0.0
 
 
 def rank_docs(query: OpenLibraryQuery, docs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Sort search results by a heuristic relevance score."""
+    target_title = query.title.lower() if query.title else ""
+    target_author = query.author.lower() if query.author else ""
+    target_general = query.general.lower() if query.general else ""
+
+    titles = [(doc.get("title") or "").lower() for doc in docs]
+    doc_authors = [[name.lower() for name in doc.get("author_name", [])] for doc in docs]
+
+    title_ratios = _similarities(target_title, titles)
+    # Exact titles earn 2.0, titles containing the query earn 1.0.
+    title_bonuses: List[float] = []
+    if target_title:
+        title_bonuses = [
+            2.0 if title == target_title else 1.0 if target_title in title else 0.0
+            for title in titles
+        ]
+
+    # Score every author of every doc in one batch, then reduce each doc's
+    # slice to its best ratio and whether any author contains the target.
+    flat_authors = [author for authors in doc_authors for author in authors]
+    flat_ratios = _similarities(target_author, flat_authors)
+    best_author_ratios: List[float] = []
+    author_hits: List[bool] = []
+    if target_author:
+        flat_hits = [target_author in author for author in flat_authors]
+        offset = 0
+        for authors in doc_authors:
+            end = offset + len(authors)
+            ratios = flat_ratios[offset:end]
+            best_author_ratios.append(max(ratios) if ratios else 0.0)
+            author_hits.append(any(flat_hits[offset:end]))
+            offset = end
+
+    # Join each doc's searchable text once, and only for keyword searches.
+    keyword_hits: List[bool] = []
+    if target_general:
+        for title, authors, doc in zip(titles, doc_authors, docs):
+            subjects = ", ".join(doc.get("subject", [])).lower()
+            haystack = " ".join(filter(None, [title, subjects, " ".join(authors)]))
+            keyword_hits.append(target_general in haystack)
+
+    numeric_bonuses = [_edition_bonus(doc.get("edition_count")) for doc in docs]
+    if query.year:
+        for index, doc in enumerate(docs):
+            numeric_bonuses[index] += _year_bonus(query.year, doc.get("first_publish_year"))
 
-    def compute_score(doc: Dict[str, Any]) -> float:
+    def compute_score(index: int, doc: Dict[str, Any]) -> float:
         score = 0.0
 
-        title = (doc.get("title") or "").lower()
-        authors = [name.lower() for name in doc.get("author_name", [])]
-        subjects = ", ".join(doc.get("subject", [])).lower()
+        if target_title:
+            score += 5.0 * title_ratios[index] + title_bonuses[index]
 
-        if query.title:
-            target_title = query.title.lower()
-            ratio = SequenceMatcher(None, target_title, title).ratio()
-            score += 5.0 * ratio
-            if target_title == title:
-                score += 2.0
-            elif target_title in title:
-                score += 1.0
-
-        if query.author:
-            target_author = query.author.lower()
-            author_ratios = [
-                SequenceMatcher(None, target_author, author).ratio()
-                for author in authors
-            ]
-            best_author_ratio = max(author_ratios) if author_ratios else 0.0
-            score += 4.0 * best_author_ratio
-            if any(target_author in author for author in authors):
+        if target_author:
+            score += 4.0 * best_author_ratios[index]
+            if author_hits[index]:
                 score += 2.0
 
-        if query.general:
-            target_general = query.general.lower()
-            haystack = " ".join(filter(None, [title, subjects, " ".join(authors)]))
-            if target_general in haystack:
-                score += 1.0
-
-        if query.year and doc.get("first_publish_year"):
-            try:
-                year_value = int(doc["first_publish_year"])
-            except (TypeError, ValueError):
-                year_value = None
-            if year_value is not None:
-                difference = abs(query.year - year_value)
-                if difference == 0:
-                    score += 2.0
-                else:
-                    score += max(0.0, 1.0 - min(difference, 50) / 50.0)
-
-        edition_count = doc.get("edition_count")
-        if isinstance(edition_count, int):
-            score += min(edition_count, 5) * 0.1
-
-        return score
-
-    scored_docs = [
-        (index, compute_score(doc), doc) for index, doc in enumerate(docs)
-    ]
-    scored_docs.sort(key=lambda item: (-item[1], item[0]))
-    return [doc for _, _, doc in scored_docs]
+        if target_general and keyword_hits[index]:
+            score += 1.0
+
+        return score + numeric_bonuses[index]
+
+    scores = [compute_score(index, doc) for index, doc in enumerate(docs)]
+    # sort() is stable even with reverse=True, so ties keep the API's order.
+    order = sorted(range(len(docs)), key=scores.__getitem__, reverse=True)
+    return [docs[index] for index in order]
 
 
 def describe_result(doc: Dict[str, Any], index: int) -> str:
@@ -171,43 +378,31 @@ def describe_result(doc: Dict[str, Any], index: int) -> str:
     return "\n".join(lines)
 
 
+def _first_str(value: Any) -> str:
+    """Return the first entry of a list-valued field (or the scalar) as text."""
+    if not value:
+        return ""
+    if isinstance(value, list):
+        return str(value[0])
+    return str(value)
+
+
 def build_record(doc: Dict[str, Any]) -> Dict[str, Any]:
     """Create a storage-ready record from an Open Library doc."""
     cover_id = doc.get("cover_i")
-    cover_url = COVER_URL_TEMPLATE.format(cover_id=cover_id) if cover_id else ""
-
-    isbns_raw = doc.get("isbn")
-    if isinstance(isbns_raw, list) and isbns_raw:
-        isbn_value = str(isbns_raw[0])
-    elif isbns_raw:
-        isbn_value = str(isbns_raw)
-    else:
-        isbn_value = ""
-
-    subjects = ", ".join(doc.get("subject", [])[:6]) if doc.get("subject") else ""
-    authors = ", ".join(doc.get("author_name", [])) if doc.get("author_name") else ""
-
-    publishers = doc.get("publisher")
-    if isinstance(publishers, list) and publishers:
-        publisher_value = str(publishers[0])
-    elif publishers:
-        publisher_value = str(publishers)
-    else:
-        publisher_value = ""
-
-    pages = doc.get("number_of_pages_median")
+    subjects = doc.get("subject")
+    authors = doc.get("author_name")
 
     return {
         "title": doc.get("title", ""),
         "subtitle": doc.get("subtitle", ""),
-        "authors": authors,
+        "authors": ", ".join(authors) if authors else "",
         "first_publish_year": doc.get("first_publish_year"),
         "edition_count": doc.get("edition_count"),
         "openlibrary_key": doc.get("key"),
-        "cover_url": cover_url,
-        "isbn": isbn_value,
-        "subjects": subjects,
-        "publisher": publisher_value,
-        "number_of_pages_median": pages,
+        "cover_url": COVER_URL_TEMPLATE.format(cover_id=cover_id) if cover_id else "",
+        "isbn": _first_str(doc.get("isbn")),
+        "subjects": ", ".join(subjects[:MAX_SUBJECTS]) if subjects else "",
+        "publisher": _first_str(doc.get("publisher")),
+        "number_of_pages_median": doc.get("number_of_pages_median"),
     }
-
@@ -1,15 +1,22 @@
 from __future__ import annotations
 
+import queue
+import sqlite3
 import sys
 import threading
 import tkinter as tk
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import messagebox, simpledialog, ttk
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
-from api import COVER_URL_TEMPLATE, OpenLibraryQuery, build_record, fetch_records
+from PIL import ImageTk
+
+from api import COVER_URL_TEMPLATE, OpenLibraryQuery, build_record, fetch_records, is_search_cached
 from inventory import InventoryStore, PlacementInfo
-from media import cached_cover_path, fetch_and_cache_cover, load_thumbnail
+from media import cached_cover_path, fetch_and_cache_cover, load_thumbnail, load_thumbnails
 
 
 # --------------------------------------------------------------------------- #
@@ -21,6 +28,64 @@ def truncate(value: str, length: int) -> str:
     return value[: length - 1] + "…"
 
 
+TreeRows = Dict[str, Tuple[Any, ...]]
+
+
+def sync_tree_rows(tree: ttk.Treeview, shown: TreeRows, rows: TreeRows) -> TreeRows:
+    """Make a flat Treeview show ``rows`` (iid -> values, in order).
+
+    ``shown`` is what the previous call returned. Only rows that were
+    removed, added or changed are touched, so a refresh that changes nothing
+    costs a single get_children() call on the Tk side.
+    """
+    removed = [iid for iid in shown if iid not in rows]
+    if removed:
+        tree.delete(*removed)
+    for index, (iid, values) in enumerate(rows.items()):
+        previous = shown.get(iid)
+        if previous is None:
+            tree.insert("", index, iid=iid, values=values)
+        elif previous != values:
+            tree.item(iid, values=values)
+    if tree.get_children("") != tuple(rows):
+        for index, iid in enumerate(rows):
+            tree.move(iid, "", index)
+    return rows
+
+
+def set_readonly_text(widget: tk.Text, text: str) -> None:
+    """Swap the contents of a disabled Text widget in one replace call."""
+    widget.configure(state="normal")
+    widget.replace("1.0", "end", text)
+    widget.configure(state="disabled")
+
+
+class PhotoCache:
+    """Small LRU of PhotoImages keyed by cover identifier.
+
+    Evicted images are only dropped from the cache; Tk frees the pixmap once
+    no card or label holds a reference to it any more.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._images: "OrderedDict[str, tk.PhotoImage]" = OrderedDict()
+
+    def __contains__(self, identifier: object) -> bool:
+        return identifier in self._images
+
+    def __getitem__(self, identifier: str) -> tk.PhotoImage:
+        image = self._images[identifier]
+        self._images.move_to_end(identifier)
+        return image
+
+    def __setitem__(self, identifier: str, image: tk.PhotoImage) -> None:
+        self._images[identifier] = image
+        self._images.move_to_end(identifier)
+        while len(self._images) > self.capacity:
+            self._images.popitem(last=False)
+
+
 # --------------------------------------------------------------------------- #
 # Search panel
 # --------------------------------------------------------------------------- #
@@ -36,18 +101,27 @@ class SearchFrame(ttk.Frame):
         self.current_page: int = 0
         self.total_results: int = 0
         self.limit: int = 5
-        self.base_bg = self.winfo_toplevel().cget("background")
+        self.base_bg = controller.background
         self.card_width = 360
         self.card_height = 140
+        self.card_gap = 12
+        self.card_pitch = self.card_height + self.card_gap
         self.card_default_bg = "#2f2f2f"
         self.card_selected_bg = "#dbe6ff"
         self.inactive_text = "#f2f2f2"
-        self.photo_cache_small: Dict[str, tk.PhotoImage] = {}
-        self.photo_cache_large: Dict[str, tk.PhotoImage] = {}
-        self.pending_small: Set[str] = set()
-        self.pending_large: Set[str] = set()
+        self.photo_cache_small = PhotoCache(128)
+        self.photo_cache_large = PhotoCache(32)
+        # Identifiers whose cover download is queued or in flight, at any size.
+        self.pending_covers: Set[str] = set()
+        # Bounded pool shared by every cover download this frame starts.
+        self._cover_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="covers")
+        # Searches run one at a time on a long-lived worker; each request is
+        # tagged with a sequence number so superseded pages are dropped.
+        self._query_queue: "queue.Queue[Tuple[int, OpenLibraryQuery, int, bool]]" = queue.Queue()
+        self._query_seq = 0
+        threading.Thread(target=self._query_worker, daemon=True).start()
         self.detail_current_key: Optional[str] = None
-        self.no_results_label: Optional[tk.Label] = None
+        self.no_results_item: Optional[int] = None
 
         self._build_ui()
 
@@ -103,34 +177,23 @@ class SearchFrame(ttk.Frame):
         self.results_canvas = tk.Canvas(
             results_container,
             highlightthickness=0,
-            background=self.winfo_toplevel().cget("background"),
+            background=self.base_bg,
         )
         self.results_canvas.grid(row=0, column=0, sticky="nsew")
-        results_scroll = ttk.Scrollbar(
+        self.results_scroll = ttk.Scrollbar(
             results_container, orient="vertical", command=self.results_canvas.yview
         )
-        results_scroll.grid(row=0, column=1, sticky="ns")
-        self.results_canvas.configure(yscrollcommand=results_scroll.set)
-
-        self.results_frame = ttk.Frame(self.results_canvas)
-        self.results_window = self.results_canvas.create_window(
-            (0, 0), window=self.results_frame, anchor="nw"
-        )
-        self.results_frame.columnconfigure(0, weight=1)
-        self.results_frame.bind(
-            "<Configure>",
-            lambda _event: self.results_canvas.configure(
-                scrollregion=self.results_canvas.bbox("all")
-            ),
+        self.results_scroll.grid(row=0, column=1, sticky="ns")
+        self.results_canvas.configure(yscrollcommand=self._on_results_scrolled)
+        self.results_canvas.bind("<Button-1>", self._on_results_click)
+        # Cards are canvas items, so wheel events over them always reach the
+        # canvas itself; one permanent binding is enough.
+        wheel_step = 1 if sys.platform == "darwin" else 120
+        self.results_canvas.bind(
+            "<MouseWheel>", lambda event: self._scroll_results(-int(event.delta / wheel_step))
         )
-        self.results_canvas.bind("<Enter>", self._bind_mousewheel)
-        self.results_canvas.bind("<Leave>", self._unbind_mousewheel)
-        self.results_frame.bind("<Enter>", self._bind_mousewheel)
-        self.results_frame.bind("<Leave>", self._unbind_mousewheel)
-        self.results_canvas.bind("<Enter>", self._bind_mousewheel)
-        self.results_canvas.bind("<Leave>", self._unbind_mousewheel)
-        self.results_frame.bind("<Enter>", self._bind_mousewheel)
-        self.results_frame.bind("<Leave>", self._unbind_mousewheel)
+        self.results_canvas.bind("<Button-4>", lambda _event: self._scroll_results(-1))
+        self.results_canvas.bind("<Button-5>", lambda _event: self._scroll_results(1))
 
         nav_frame = ttk.Frame(results_container)
         nav_frame.grid(row=1, column=0, columnspan=2, sticky="ew", pady=(8, 0))
@@ -162,7 +225,7 @@ class SearchFrame(ttk.Frame):
             height=15,
             wrap="word",
             state="disabled",
-            background=self.winfo_toplevel().cget("background"),
+            background=self.base_bg,
             relief="flat",
         )
         self.detail_text.grid(row=1, column=0, sticky="nsew")
@@ -207,15 +270,32 @@ class SearchFrame(ttk.Frame):
         self.controller.set_status("Searching Open Library…")
         query = self.current_query
         query.limit = self.limit
-        threading.Thread(
-            target=self._search_thread, args=(query, offset), daemon=True
-        ).start()
+        self._query_seq += 1
+        self._query_queue.put((self._query_seq, query, offset, False))
 
-    def _search_thread(self, query: OpenLibraryQuery, offset: int) -> None:
-        docs, total = fetch_records(query, offset=offset)
-        self.after(0, lambda: self._on_search_complete(docs, total))
+    def _query_worker(self) -> None:
+        while True:
+            seq, query, offset, prefetch = self._query_queue.get()
+            if seq != self._query_seq:
+                continue
+            try:
+                docs, total = fetch_records(query, offset=offset)
+            except Exception as error:  # keep the worker alive for the next search
+                if not prefetch:
+                    self.after(0, self._on_search_failed, seq, error)
+                continue
+            if not prefetch:
+                self.after(0, self._on_search_complete, seq, docs, total)
 
-    def _on_search_complete(self, results: List[Dict], total: int) -> None:
+    def _on_search_failed(self, seq: int, error: Exception) -> None:
+        if seq != self._query_seq:
+            return
+        self._set_search_state(active=False)
+        self.controller.set_status(f"Search failed: {error}")
+
+    def _on_search_complete(self, seq: int, results: List[Dict], total: int) -> None:
+        if seq != self._query_seq:
+            return
         self._set_search_state(active=False)
         self.results = results
         self.total_results = total
@@ -233,6 +313,17 @@ class SearchFrame(ttk.Frame):
         self.add_button.configure(state="disabled")
         self._show_details(None)
 
+        # Warm fetch_records' cache with the next page while this one is read.
+        # A Next click queued behind the prefetch then returns from the cache;
+        # any newer request makes a not-yet-started prefetch stale.
+        next_offset = (self.current_page + 1) * self.limit
+        if (
+            self.current_query
+            and next_offset < total
+            and not is_search_cached(self.current_query, next_offset)
+        ):
+            self._query_queue.put((seq, self.current_query, next_offset, True))
+
     def _set_search_state(self, *, active: bool) -> None:
         state = "disabled" if active else "normal"
         self.search_button.configure(state=state)
@@ -242,230 +333,260 @@ class SearchFrame(ttk.Frame):
 
     def _render_results(self) -> None:
         needed_cards = max(len(self.results), self.limit)
-        self._ensure_card_widgets(needed_cards)
+        self._ensure_card_items(needed_cards)
+        canvas = self.results_canvas
 
-        if self.no_results_label is None:
-            self.no_results_label = tk.Label(
-                self.results_frame,
+        if self.no_results_item is None:
+            self.no_results_item = canvas.create_text(
+                self.card_gap // 2 + self.card_width / 2,
+                24,
                 text="No results yet. Enter search details and click search.",
                 justify="center",
-                background=self.base_bg,
-                foreground="#dddddd",
+                fill="#dddddd",
             )
 
-        if not self.results:
-            self.no_results_label.pack(pady=12)
-            for card in self.cards:
-                card["wrapper"].pack_forget()
+        for card in self.cards[len(self.results):]:
+            if card["doc"] is not None:
+                canvas.itemconfigure(card["tag"], state="hidden")
                 card["doc_key"] = None
                 card["doc"] = None
-            self.results_frame.update_idletasks()
-            self.results_canvas.configure(scrollregion=self.results_canvas.bbox("all"))
-            return
 
-        self.no_results_label.pack_forget()
+        if not self.results:
+            canvas.itemconfigure(self.no_results_item, state="normal")
+            canvas.configure(scrollregion=canvas.bbox(self.no_results_item))
+            return
 
-        for card in self.cards:
-            card["wrapper"].pack_forget()
-            card["doc_key"] = None
-            card["doc"] = None
+        canvas.itemconfigure(self.no_results_item, state="hidden")
 
         for idx, doc in enumerate(self.results):
             card = self.cards[idx]
-            card["wrapper"].pack(fill="x")
             card["doc"] = doc
+            card["details"] = None
             identifier = doc.get("key") or doc.get("isbn") or doc.get("title") or str(idx)
             card["doc_key"] = identifier
 
-            frame = card["frame"]
-            frame.configure(bg=self.card_default_bg)
-            card["title_label"].configure(bg=self.card_default_bg, fg=self.inactive_text)
-            card["authors_label"].configure(bg=self.card_default_bg, fg=self.inactive_text)
-            card["year_label"].configure(bg=self.card_default_bg, fg=self.inactive_text)
-
-            title = doc.get("title") or "Untitled"
-            card["title_label"].configure(text=title)
-
-            authors = ", ".join(doc.get("author_name", [])[:3]) or "Unknown author"
-            card["authors_label"].configure(text=authors)
+            # The image/placeholder pair is sorted out by _set_placeholder_image.
+            canvas.itemconfigure(card["tag"], state="normal")
 
             year = doc.get("first_publish_year")
-            card["year_label"].configure(text=f"First published: {year or 'N/A'}")
+            texts = (
+                doc.get("title") or "Untitled",
+                ", ".join(doc.get("author_name", [])[:3]) or "Unknown author",
+                f"First published: {year or 'N/A'}",
+            )
+            # Paging back and forth often lands the same doc on the same card.
+            if card["texts"] != texts:
+                card["texts"] = texts
+                canvas.itemconfigure(card["title"], text=texts[0])
+                canvas.itemconfigure(card["authors"], text=texts[1])
+                canvas.itemconfigure(card["year"], text=texts[2])
+                self._layout_card_text(card)
 
             cover_id = doc.get("cover_i")
-            cover_url = (
+            card["cover_url"] = (
                 COVER_URL_TEMPLATE.format(cover_id=cover_id) if cover_id else doc.get("cover_url")
             )
-            self._set_card_image(card, identifier, cover_url)
+            # Covers are resolved lazily once the card scrolls into view.
+            card["cover_resolved"] = False
+            self._set_placeholder_image(card)
 
-        self.results_frame.update_idletasks()
-        self.results_canvas.configure(scrollregion=self.results_canvas.bbox("all"))
-        self.results_canvas.yview_moveto(0)
-        self._apply_card_styles()
+        canvas.configure(
+            scrollregion=(0, 0, self.card_width + self.card_gap, len(self.results) * self.card_pitch)
+        )
+        canvas.yview_moveto(0)
+        self._refresh_visible()
 
-    def _ensure_card_widgets(self, count: int) -> None:
+    def _ensure_card_items(self, count: int) -> None:
         while len(self.cards) < count:
-            self.cards.append(self._create_card())
-
-    def _create_card(self) -> Dict[str, Any]:
-        wrapper = tk.Frame(self.results_frame, bg=self.base_bg)
-        frame = tk.Frame(
-            wrapper,
-            bg=self.card_default_bg,
-            highlightthickness=0,
-            bd=0,
-            width=self.card_width,
-            height=self.card_height,
+            self.cards.append(self._create_card(len(self.cards)))
+
+    def _create_card(self, index: int) -> Dict[str, Any]:
+        """Draw one result card as canvas items; returns the item ids."""
+        canvas = self.results_canvas
+        tag = f"card{index}"
+        left = self.card_gap // 2
+        top = index * self.card_pitch + self.card_gap // 2
+        text_left = left + 104
+
+        bg = canvas.create_rectangle(
+            left,
+            top,
+            left + self.card_width,
+            top + self.card_height,
+            fill=self.card_default_bg,
+            width=0,
+            tags=(tag,),
         )
-        frame.pack(pady=6)
-        frame.pack_propagate(False)
-        frame.columnconfigure(1, weight=1)
-
-        image_label = tk.Label(
-            frame,
-            bg="#4a4a4a",
-            fg="#dcdcdc",
-            font=("Helvetica", 9, "bold"),
+        cover_bg = canvas.create_rectangle(
+            left + 10,
+            top + 10,
+            left + 90,
+            top + self.card_height - 10,
+            fill="#4a4a4a",
+            width=0,
+            tags=(tag,),
+        )
+        cover_center = (left + 50, top + self.card_height / 2)
+        placeholder = canvas.create_text(
+            *cover_center,
             text="NO\nCOVER",
+            font=("Helvetica", 9, "bold"),
+            fill="#dcdcdc",
             justify="center",
-            width=9,
-            height=5,
-            padx=6,
-            pady=6,
+            tags=(tag,),
         )
-        image_label.grid(row=0, column=0, rowspan=3, sticky="nsw", padx=(10, 14))
-
-        title_label = tk.Label(
-            frame,
+        image = canvas.create_image(*cover_center, tags=(tag,))
+        title = canvas.create_text(
+            text_left,
+            top + 12,
+            anchor="nw",
             text="",
             font=("Helvetica", 11, "bold"),
-            wraplength=220,
+            width=220,
             justify="left",
-            bg=self.card_default_bg,
-            fg=self.inactive_text,
+            fill=self.inactive_text,
+            tags=(tag,),
         )
-        title_label.grid(row=0, column=1, sticky="w")
-
-        authors_label = tk.Label(
-            frame,
+        authors = canvas.create_text(
+            text_left,
+            top + 40,
+            anchor="nw",
             text="",
-            wraplength=220,
+            width=220,
             justify="left",
-            bg=self.card_default_bg,
-            fg=self.inactive_text,
+            fill=self.inactive_text,
+            tags=(tag,),
         )
-        authors_label.grid(row=1, column=1, sticky="w")
-
-        year_label = tk.Label(
-            frame,
+        year = canvas.create_text(
+            text_left,
+            top + 60,
+            anchor="nw",
             text="",
-            bg=self.card_default_bg,
-            fg=self.inactive_text,
             justify="left",
+            fill=self.inactive_text,
+            tags=(tag,),
         )
-        year_label.grid(row=2, column=1, sticky="w")
-
-        card = {
-            "wrapper": wrapper,
-            "frame": frame,
-            "image_label": image_label,
-            "title_label": title_label,
-            "authors_label": authors_label,
-            "year_label": year_label,
+        canvas.itemconfigure(tag, state="hidden")
+        return {
+            "tag": tag,
+            "top": top,
+            "bg": bg,
+            "cover_bg": cover_bg,
+            "placeholder": placeholder,
+            "image": image,
+            "title": title,
+            "authors": authors,
+            "year": year,
+            "texts": None,
+            "details": None,
+            "has_image": False,
+            "photo": None,
+            "cover_url": None,
+            "cover_resolved": False,
+            "style": None,
             "doc_key": None,
             "doc": None,
         }
-        self._bind_card_events(card)
-        wrapper.pack_forget()
-        return card
 
-    def _bind_card_events(self, card: Dict[str, Any]) -> None:
-        def handler(_event, c=card):
-            if c.get("doc_key") is None:
-                return
-            try:
-                index = self.cards.index(c)
-            except ValueError:
-                return
-            if index >= len(self.results):
-                return
-            self._select_index(index)
-
-        for widget in (
-            card["frame"],
-            card["image_label"],
-            card["title_label"],
-            card["authors_label"],
-            card["year_label"],
-        ):
-            widget.bind("<Button-1>", handler)
+    def _layout_card_text(self, card: Dict[str, Any]) -> None:
+        """Stack the author and year lines under the (possibly wrapped) title."""
+        canvas = self.results_canvas
+        text_left = self.card_gap // 2 + 104
+        title_box = canvas.bbox(card["title"])
+        authors_top = (title_box[3] if title_box else card["top"] + 30) + 2
+        canvas.coords(card["authors"], text_left, authors_top)
+        authors_box = canvas.bbox(card["authors"])
+        year_top = (authors_box[3] if authors_box else authors_top + 18) + 2
+        canvas.coords(card["year"], text_left, year_top)
+
+    def _visible_card_range(self) -> range:
+        """Indexes of the result cards that intersect the visible viewport."""
+        canvas = self.results_canvas
+        top = canvas.canvasy(0)
+        bottom = top + canvas.winfo_height()
+        first = max(int(top // self.card_pitch), 0)
+        last = min(int(bottom // self.card_pitch) + 1, len(self.results))
+        return range(first, last)
+
+    def _on_results_scrolled(self, first: str, last: str) -> None:
+        self.results_scroll.set(first, last)
+        self._refresh_visible()
+
+    def _refresh_visible(self) -> None:
+        """Resolve covers and styles for cards that have scrolled into view."""
+        for idx in self._visible_card_range():
+            card = self.cards[idx]
+            if card["doc_key"] is not None and not card["cover_resolved"]:
+                card["cover_resolved"] = True
+                self._set_card_image(card, card["doc_key"], card["cover_url"])
+        self._apply_card_styles()
 
-    def _set_placeholder_image(self, label: tk.Label) -> None:
-        label.configure(
-            image="",
-            text="NO\nCOVER",
-            font=("Helvetica", 9, "bold"),
-            bg="#4a4a4a",
-            fg="#dcdcdc",
-            justify="center",
-            width=9,
-            height=5,
-            padx=6,
-            pady=6,
-        )
-        label.image = None
+    def _on_results_click(self, event: tk.Event) -> None:
+        canvas = self.results_canvas
+        x = canvas.canvasx(event.x)
+        y = canvas.canvasy(event.y)
+        index = int(y // self.card_pitch)
+        if index < 0 or index >= len(self.results):
+            return
+        card = self.cards[index]
+        left = self.card_gap // 2
+        if not (left <= x <= left + self.card_width):
+            return
+        if not (card["top"] <= y <= card["top"] + self.card_height):
+            return
+        self._select_index(index)
+
+    def _set_placeholder_image(self, card: Dict[str, Any]) -> None:
+        canvas = self.results_canvas
+        canvas.itemconfigure(card["image"], image="", state="hidden")
+        canvas.itemconfigure(card["placeholder"], state="normal")
+        card["has_image"] = False
+        card["photo"] = None
+
+    def _show_card_image(self, card: Dict[str, Any], image: tk.PhotoImage) -> None:
+        canvas = self.results_canvas
+        canvas.itemconfigure(card["image"], image=image, state="normal")
+        canvas.itemconfigure(card["placeholder"], state="hidden")
+        card["has_image"] = True
+        # Canvas items do not keep their PhotoImage alive; the card does.
+        card["photo"] = image
 
     def _set_card_image(self, card: Dict[str, Any], identifier: str, cover_url: Optional[str]) -> None:
-        label = card["image_label"]
         if identifier in self.photo_cache_small:
-            image = self.photo_cache_small[identifier]
-            label.configure(image=image, text="")
-            label.image = image
+            self._show_card_image(card, self.photo_cache_small[identifier])
         else:
-            self._set_placeholder_image(label)
-            if cover_url and identifier not in self.pending_small:
-                self.pending_small.add(identifier)
-                threading.Thread(
-                    target=self._load_cover_background,
-                    args=(cover_url, identifier, "small"),
-                    daemon=True,
-                ).start()
-
-    def _load_cover_background(
-        self, cover_url: str, identifier: str, size: str
-    ) -> None:
-        max_edge = 200 if size == "small" else 600
-        path = fetch_and_cache_cover(cover_url, identifier, max_edge=max_edge)
+            self._set_placeholder_image(card)
+            self._request_cover(cover_url, identifier)
+
+    def _request_cover(self, cover_url: Optional[str], identifier: str) -> None:
+        if cover_url and identifier not in self.pending_covers:
+            self.pending_covers.add(identifier)
+            self._cover_pool.submit(self._load_cover_background, cover_url, identifier)
+
+    def _load_cover_background(self, cover_url: str, identifier: str) -> None:
+        # One 600px file on disk serves both the card and the detail cover.
+        path = fetch_and_cache_cover(cover_url, identifier, max_edge=600)
+        # Decode and resize here, off the UI thread, from a single file read.
+        thumbnails = load_thumbnails(path, ((80, 120), (240, 360))) if path else None
 
         def apply():
-            if size == "small":
-                self.pending_small.discard(identifier)
-            else:
-                self.pending_large.discard(identifier)
-            if not path:
+            self.pending_covers.discard(identifier)
+            if not thumbnails:
                 return
-            cache = self.photo_cache_small if size == "small" else self.photo_cache_large
-            if identifier in cache:
-                image = cache[identifier]
-            else:
-                dims = (80, 120) if size == "small" else (240, 360)
-                image = load_thumbnail(Path(path), dims)
-                if not image:
-                    return
-                cache[identifier] = image
-            if size == "small":
+            small, large = thumbnails
+            if identifier not in self.photo_cache_small:
+                image = ImageTk.PhotoImage(small)
+                self.photo_cache_small[identifier] = image
                 self._apply_small_image(identifier, image)
-            else:
-                self._apply_detail_image(identifier, image)
+            if self.detail_current_key == identifier and identifier not in self.photo_cache_large:
+                self._apply_detail_image(identifier, ImageTk.PhotoImage(large))
 
         self.after(0, apply)
 
     def _apply_small_image(self, identifier: str, image: tk.PhotoImage) -> None:
         for card in self.cards:
             if card.get("doc_key") == identifier:
-                label = card["image_label"]
-                label.configure(image=image, text="")
-                label.image = image
+                self._show_card_image(card, image)
         self._apply_card_styles()
 
     def _apply_detail_image(self, identifier: str, image: tk.PhotoImage) -> None:
@@ -474,33 +595,7 @@ class SearchFrame(ttk.Frame):
             self.current_cover_image = image
             self.cover_label.configure(image=image, text="")
 
-    def _bind_mousewheel(self, _event: tk.Event) -> None:
-        self.results_canvas.bind("<MouseWheel>", self._on_mousewheel)
-        self.results_frame.bind("<MouseWheel>", self._on_mousewheel)
-        self.results_canvas.bind("<Button-4>", self._on_mousewheel)
-        self.results_canvas.bind("<Button-5>", self._on_mousewheel)
-        self.results_frame.bind("<Button-4>", self._on_mousewheel)
-        self.results_frame.bind("<Button-5>", self._on_mousewheel)
-
-    def _unbind_mousewheel(self, _event: tk.Event) -> None:
-        self.results_canvas.unbind("<MouseWheel>")
-        self.results_frame.unbind("<MouseWheel>")
-        self.results_canvas.unbind("<Button-4>")
-        self.results_canvas.unbind("<Button-5>")
-        self.results_frame.unbind("<Button-4>")
-        self.results_frame.unbind("<Button-5>")
-
-    def _on_mousewheel(self, event: tk.Event) -> None:
-        delta = 0
-        if event.delta:
-            if sys.platform == "darwin":
-                delta = -int(event.delta)
-            else:
-                delta = -int(event.delta / 120)
-        elif event.num == 4:
-            delta = -1
-        elif event.num == 5:
-            delta = 1
+    def _scroll_results(self, delta: int) -> None:
         if delta:
             self.results_canvas.yview_scroll(delta, "units")
 
@@ -514,29 +609,29 @@ class SearchFrame(ttk.Frame):
             return
         self.selected_index = index
         self._apply_card_styles()
-        doc = self.results[index]
         self.add_button.configure(state="normal")
-        self._show_details(doc)
+        self._show_details(self.cards[index])
 
     def _apply_card_styles(self) -> None:
-        for idx, card in enumerate(self.cards):
+        canvas = self.results_canvas
+        # Off-screen cards are styled when they scroll in (see _refresh_visible).
+        for idx in self._visible_card_range():
+            card = self.cards[idx]
             if not card.get("doc_key"):
                 continue
             selected = idx == self.selected_index
+            style = (selected, card["has_image"])
+            if card["style"] == style:
+                continue
+            card["style"] = style
             color = self._card_color(selected)
             text_color = "#111111" if selected else self.inactive_text
 
-            frame = card["frame"]
-            frame.configure(bg=color)
-            card["title_label"].configure(bg=color, fg=text_color)
-            card["authors_label"].configure(bg=color, fg=text_color)
-            card["year_label"].configure(bg=color, fg=text_color)
-
-            image_label = card["image_label"]
-            if getattr(image_label, "image", None):
-                image_label.configure(bg=color)
-            else:
-                image_label.configure(bg="#4a4a4a")
+            canvas.itemconfigure(card["bg"], fill=color)
+            canvas.itemconfigure(card["title"], fill=text_color)
+            canvas.itemconfigure(card["authors"], fill=text_color)
+            canvas.itemconfigure(card["year"], fill=text_color)
+            canvas.itemconfigure(card["cover_bg"], fill=color if card["has_image"] else "#4a4a4a")
 
     def _update_navigation(self) -> None:
         if not self.current_query or self.total_results == 0:
@@ -572,62 +667,63 @@ class SearchFrame(ttk.Frame):
         self.current_page += 1
         self._fetch_page()
 
-    def _show_details(self, doc: Optional[Dict]) -> None:
-        self.detail_text.configure(state="normal")
-        self.detail_text.delete("1.0", "end")
+    def _show_details(self, card: Optional[Dict[str, Any]]) -> None:
         self.cover_label.configure(image="", text="", foreground="#888888")
         self.current_cover_image = None
         self.detail_current_key = None
 
+        doc = card["doc"] if card else None
         if not doc:
-            self.detail_text.insert("end", "Select a result to see its details here.")
-            self.detail_text.configure(state="disabled")
+            set_readonly_text(self.detail_text, "Select a result to see its details here.")
             return
 
-        lines = [
-            f"Title: {doc.get('title', 'Untitled')}",
-            f"Author(s): {', '.join(doc.get('author_name', [])) or 'Unknown'}",
-        ]
-        if doc.get("first_publish_year"):
-            lines.append(f"First Publish Year: {doc.get('first_publish_year')}")
-        if doc.get("publisher"):
-            lines.append(f"Publisher: {', '.join(doc.get('publisher', [])[:2])}")
-        if doc.get("subject"):
-            lines.append(f"Subjects: {', '.join(doc.get('subject', [])[:6])}")
-        lines.append(f"Open Library Key: {doc.get('key')}")
-
-        self.detail_text.insert("end", "\n".join(lines))
-        self.detail_text.configure(state="disabled")
+        if card["details"] is None:
+            card["details"] = self._format_details(doc)
+        set_readonly_text(self.detail_text, card["details"])
 
-        identifier = doc.get("key") or doc.get("isbn") or doc.get("title")
+        # Worked out once per page in _render_results.
+        identifier = card["doc_key"]
+        cover_url = card["cover_url"]
         self.detail_current_key = identifier
-        cover_id = doc.get("cover_i")
-        cover_url = (
-            COVER_URL_TEMPLATE.format(cover_id=cover_id) if cover_id else doc.get("cover_url")
-        )
 
-        if identifier and identifier in self.photo_cache_large:
+        if identifier in self.photo_cache_large:
             image = self.photo_cache_large[identifier]
             self.current_cover_image = image
             self.cover_label.configure(image=image, text="")
-        elif cover_url and identifier:
+        elif cover_url:
             self.cover_label.configure(text="Loading cover…", foreground="#888888")
-            if identifier not in self.pending_large:
-                self.pending_large.add(identifier)
-                threading.Thread(
-                    target=self._load_cover_background,
-                    args=(cover_url, identifier, "large"),
-                    daemon=True,
-                ).start()
+            self._request_cover(cover_url, identifier)
         else:
             self.cover_label.configure(text="No cover available", foreground="#888888")
 
+    @staticmethod
+    def _format_details(doc: Dict) -> str:
+        lines = [
+            f"Title: {doc.get('title', 'Untitled')}",
+            f"Author(s): {', '.join(doc.get('author_name', [])) or 'Unknown'}",
+        ]
+        year = doc.get("first_publish_year")
+        if year:
+            lines.append(f"First Publish Year: {year}")
+        publishers = doc.get("publisher")
+        if publishers:
+            lines.append(f"Publisher: {', '.join(publishers[:2])}")
+        subjects = doc.get("subject")
+        if subjects:
+            lines.append(f"Subjects: {', '.join(subjects[:6])}")
+        lines.append(f"Open Library Key: {doc.get('key')}")
+        return "\n".join(lines)
+
     def add_selected_to_inventory(self) -> None:
         if self.selected_index is None:
             return
         doc = self.results[self.selected_index]
         self.controller.add_book_from_doc(doc)
 
+    def destroy(self) -> None:
+        self._cover_pool.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
+
 
 # --------------------------------------------------------------------------- #
 # Inventory panel
@@ -637,7 +733,12 @@ class InventoryFrame(ttk.Frame):
         super().__init__(master, padding=12)
         self.controller = controller
         self.books: List[Dict] = []
+        self._books_by_id: Dict[int, Dict] = {}
+        # Treeview iid -> values tuple currently shown for that row.
+        self._tree_state: TreeRows = {}
         self.current_cover_image: Optional[tk.PhotoImage] = None
+        self._search_after_id: Optional[str] = None
+        self._shown_book_id: Optional[int] = None
         self._build_ui()
 
     def _build_ui(self) -> None:
@@ -649,7 +750,7 @@ class InventoryFrame(ttk.Frame):
         self.search_var = tk.StringVar()
         entry = ttk.Entry(top, textvariable=self.search_var)
         entry.grid(row=0, column=1, sticky="ew", padx=(4, 0))
-        self.search_var.trace_add("write", lambda *_: self.refresh_books())
+        self.search_var.trace_add("write", lambda *_: self._schedule_refresh())
 
         self.refresh_button = ttk.Button(
             top, text="Refresh", command=self.refresh_books, width=12
@@ -695,7 +796,7 @@ class InventoryFrame(ttk.Frame):
             height=12,
             wrap="word",
             state="disabled",
-            background=self.winfo_toplevel().cget("background"),
+            background=self.controller.background,
             relief="flat",
         )
         self.info_text.grid(row=1, column=0, sticky="nsew")
@@ -728,30 +829,42 @@ class InventoryFrame(ttk.Frame):
         self.delete_button.grid(row=0, column=2)
 
     # ------------------------------------------------------------------
+    def _schedule_refresh(self) -> None:
+        """Coalesce bursts of typing into a single inventory query."""
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(200, self.refresh_books)
+
     def refresh_books(self) -> None:
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+            self._search_after_id = None
         term = self.search_var.get().strip()
         self.books = self.controller.store.list_books(term)
+        self._books_by_id = {book["id"]: book for book in self.books}
 
         current_selection = self.tree.selection()
         selected_id = int(current_selection[0]) if current_selection else None
 
-        self.tree.delete(*self.tree.get_children())
-        for book in self.books:
-            book_id = book["id"]
-            authors = book.get("authors") or ""
-            shelf = book.get("shelf_name") or ""
-            slot = book.get("slot_index") or ""
-            year = book.get("first_publish_year") or ""
-            self.tree.insert(
-                "",
-                "end",
-                iid=str(book_id),
-                values=(authors, year, shelf, slot),
-            )
+        # A no-op filter or a single placement edit should not rebuild the tree.
+        self._tree_state = sync_tree_rows(
+            self.tree,
+            self._tree_state,
+            {
+                str(book["id"]): (
+                    book.get("authors") or "",
+                    book.get("first_publish_year") or "",
+                    book.get("shelf_name") or "",
+                    book.get("slot_index") or "",
+                )
+                for book in self.books
+            },
+        )
 
-        if selected_id and str(selected_id) in self.tree.get_children(""):
-            self.tree.selection_set(str(selected_id))
-            self.tree.focus(str(selected_id))
+        if selected_id in self._books_by_id:
+            # The row kept its selection, so no <<TreeviewSelect>> fires;
+            # redraw the details from the freshly loaded record instead.
+            self._show_book(self._books_by_id[selected_id])
         else:
             self._show_book(None)
 
@@ -761,63 +874,70 @@ class InventoryFrame(ttk.Frame):
             self._show_book(None)
             return
         book_id = int(selection[0])
-        book = next((b for b in self.books if b["id"] == book_id), None)
+        # Re-selecting the row already shown (or the echo of select_book)
+        # has nothing new to display; refresh_books redraws stale details.
+        if book_id == self._shown_book_id:
+            return
+        book = self._books_by_id.get(book_id)
         self._show_book(book)
         if book:
             self.controller.visual_frame.highlight_book(book_id)
 
     def _show_book(self, book: Optional[Dict]) -> None:
-        self.info_text.configure(state="normal")
-        self.info_text.delete("1.0", "end")
-        self.cover_label.configure(image="", text="")
+        self._shown_book_id = book["id"] if book else None
+        previous_image = self.current_cover_image
         self.current_cover_image = None
-        self.place_button.configure(state="disabled")
-        self.remove_button.configure(state="disabled")
-        self.delete_button.configure(state="disabled")
-
         if not book:
-            self.info_text.insert("end", "Select a book to see its details.")
-            self.info_text.configure(state="disabled")
+            self.cover_label.configure(image="", text="")
+            for button in (self.place_button, self.remove_button, self.delete_button):
+                button.configure(state="disabled")
+            set_readonly_text(self.info_text, "Select a book to see its details.")
             return
 
+        placed = book.get("shelf_row_id") is not None
+        set_readonly_text(self.info_text, self._format_book(book, placed))
+
+        cover_path = book.get("cover_path")
+        image = load_thumbnail(Path(cover_path), size=(180, 250)) if cover_path else None
+        if image:
+            self.current_cover_image = image
+            # load_thumbnail hands back the cached PhotoImage for an unchanged file.
+            if image is not previous_image:
+                self.cover_label.configure(image=image, text="")
+        else:
+            self.cover_label.configure(image="", text="No cover available", foreground="#888888")
+
+        self.place_button.configure(state="normal")
+        self.remove_button.configure(state="normal" if placed else "disabled")
+        self.delete_button.configure(state="normal")
+
+    @staticmethod
+    def _format_book(book: Dict, placed: bool) -> str:
         lines = [
             f"Title: {book.get('title')}",
             f"Subtitle: {book.get('subtitle') or '—'}",
             f"Author(s): {book.get('authors') or 'Unknown'}",
         ]
-        if book.get("first_publish_year"):
-            lines.append(f"First Publish Year: {book.get('first_publish_year')}")
-        if book.get("publisher"):
-            lines.append(f"Publisher: {book.get('publisher')}")
-        if book.get("isbn"):
-            lines.append(f"ISBN: {book.get('isbn')}")
-        if book.get("subjects"):
-            lines.append(f"Subjects: {book.get('subjects')}")
+        for label, key in (
+            ("First Publish Year", "first_publish_year"),
+            ("Publisher", "publisher"),
+            ("ISBN", "isbn"),
+            ("Subjects", "subjects"),
+        ):
+            value = book.get(key)
+            if value:
+                lines.append(f"{label}: {value}")
         lines.append(f"Open Library Key: {book.get('openlibrary_key')}")
 
-        placement = self.controller.store.get_placement(book["id"])
-        if placement:
+        # list_books already joins the placement, so no extra query is needed.
+        if placed:
+            row_name = book.get("row_name") or f"Row {book.get('row_position')}"
             lines.append(
-                f"Location: {placement.shelf_name} → {placement.row_name} (Slot {placement.slot_index})"
+                f"Location: {book.get('shelf_name')} → {row_name} (Slot {book.get('slot_index')})"
             )
-            self.remove_button.configure(state="normal")
         else:
             lines.append("Location: Not yet placed.")
-
-        self.info_text.insert("end", "\n".join(lines))
-        self.info_text.configure(state="disabled")
-
-        cover_path = book.get("cover_path")
-        if cover_path:
-            image = load_thumbnail(Path(cover_path), size=(180, 250))
-            if image:
-                self.current_cover_image = image
-                self.cover_label.configure(image=image)
-        if not self.current_cover_image:
-            self.cover_label.configure(text="No cover available", foreground="#888888")
-
-        self.place_button.configure(state="normal")
-        self.delete_button.configure(state="normal")
+        return "\n".join(lines)
 
     def _place_selected(self) -> None:
         selection = self.tree.selection()
@@ -844,14 +964,14 @@ class InventoryFrame(ttk.Frame):
             return
         self.controller.set_status("Placement removed.")
         self.refresh_books()
-        self.controller.visual_frame.refresh()
+        self.controller.request_refresh(self.controller.visual_frame)
 
     def _delete_book(self) -> None:
         selection = self.tree.selection()
         if not selection:
             return
         book_id = int(selection[0])
-        book = next((b for b in self.books if b["id"] == book_id), None)
+        book = self._books_by_id.get(book_id)
         if not book:
             return
         if not messagebox.askyesno(
@@ -863,16 +983,16 @@ class InventoryFrame(ttk.Frame):
         self.controller.store.delete_book(book_id)
         self.controller.set_status(f"Deleted '{book.get('title')}'.")
         self.refresh_books()
-        self.controller.visual_frame.refresh()
+        self.controller.request_refresh(self.controller.visual_frame)
 
     def select_book(self, book_id: int) -> None:
-        if str(book_id) in self.tree.get_children(""):
+        if book_id in self._books_by_id:
             self.tree.selection_set(str(book_id))
             self.tree.focus(str(book_id))
             self.tree.see(str(book_id))
         else:
             self.refresh_books()
-            if str(book_id) in self.tree.get_children(""):
+            if book_id in self._books_by_id:
                 self.tree.selection_set(str(book_id))
                 self.tree.focus(str(book_id))
 
@@ -884,8 +1004,12 @@ class ShelfFrame(ttk.Frame):
     def __init__(self, master: ttk.Notebook, controller: "MainApplication"):
         super().__init__(master, padding=12)
         self.controller = controller
-        self.shelves: List[Dict] = []
-        self.rows: List[Dict] = []
+        self.shelves: List[sqlite3.Row] = []
+        self.rows: List[sqlite3.Row] = []
+        self._shelves_by_id: Dict[int, sqlite3.Row] = {}
+        self._rows_by_id: Dict[int, sqlite3.Row] = {}
+        self._shelf_tree_state: TreeRows = {}
+        self._row_tree_state: TreeRows = {}
         self.selected_shelf_id: Optional[int] = None
         self._build_ui()
 
@@ -974,27 +1098,25 @@ class ShelfFrame(ttk.Frame):
 
     def refresh(self) -> None:
         self.shelves = self.controller.store.list_shelves()
-        self.shelf_tree.delete(*self.shelf_tree.get_children())
-        for shelf in self.shelves:
-            self.shelf_tree.insert(
-                "",
-                "end",
-                iid=str(shelf["id"]),
-                values=(shelf["row_count"], shelf["capacity"]),
-            )
+        self._shelves_by_id = {shelf["id"]: shelf for shelf in self.shelves}
+        self._shelf_tree_state = sync_tree_rows(
+            self.shelf_tree,
+            self._shelf_tree_state,
+            {str(shelf["id"]): (shelf["row_count"], shelf["capacity"]) for shelf in self.shelves},
+        )
         if self.shelves:
             first_shelf_id = self.shelves[0]["id"]
             self.shelf_tree.selection_set(str(first_shelf_id))
             self._load_rows(first_shelf_id)
         else:
-            self.row_tree.delete(*self.row_tree.get_children())
+            self._row_tree_state = sync_tree_rows(self.row_tree, self._row_tree_state, {})
             self.selected_shelf_id = None
 
     def _on_select_shelf(self, _event: tk.Event) -> None:
         selection = self.shelf_tree.selection()
         if not selection:
             self.selected_shelf_id = None
-            self.row_tree.delete(*self.row_tree.get_children())
+            self._row_tree_state = sync_tree_rows(self.row_tree, self._row_tree_state, {})
             return
         shelf_id = int(selection[0])
         self._load_rows(shelf_id)
@@ -1002,15 +1124,20 @@ class ShelfFrame(ttk.Frame):
     def _load_rows(self, shelf_id: int) -> None:
         self.selected_shelf_id = shelf_id
         self.rows = self.controller.store.list_rows(shelf_id)
-        self.row_tree.delete(*self.row_tree.get_children())
-        for row in self.rows:
-            name = row.get("name") or f"Row {row['position']}"
-            self.row_tree.insert(
-                "",
-                "end",
-                iid=str(row["id"]),
-                values=(row["position"], name, row["capacity"], row["used"]),
-            )
+        self._rows_by_id = {row["id"]: row for row in self.rows}
+        self._row_tree_state = sync_tree_rows(
+            self.row_tree,
+            self._row_tree_state,
+            {
+                str(row["id"]): (
+                    row["position"],
+                    row["name"] or f"Row {row['position']}",
+                    row["capacity"],
+                    row["used"],
+                )
+                for row in self.rows
+            },
+        )
 
     def _add_shelf(self) -> None:
         name = simpledialog.askstring("Create shelf", "Shelf name:", parent=self)
@@ -1025,7 +1152,7 @@ class ShelfFrame(ttk.Frame):
             messagebox.showerror("Error", str(error), parent=self)
             return
         self.refresh()
-        self.controller.visual_frame.refresh()
+        self.controller.request_refresh(self.controller.visual_frame)
         self.controller.set_status(f"Created shelf '{name}'.")
 
     def _rename_shelf(self) -> None:
@@ -1033,7 +1160,7 @@ class ShelfFrame(ttk.Frame):
         if not selection:
             return
         shelf_id = int(selection[0])
-        shelf = next((s for s in self.shelves if s["id"] == shelf_id), None)
+        shelf = self._shelves_by_id.get(shelf_id)
         if not shelf:
             return
         name = simpledialog.askstring(
@@ -1044,7 +1171,7 @@ class ShelfFrame(ttk.Frame):
         description = simpledialog.askstring(
             "Rename shelf",
             "Description:",
-            initialvalue=shelf.get("description") or "",
+            initialvalue=shelf["description"] or "",
             parent=self,
         )
         try:
@@ -1053,7 +1180,7 @@ class ShelfFrame(ttk.Frame):
             messagebox.showerror("Error", str(error), parent=self)
             return
         self.refresh()
-        self.controller.visual_frame.refresh()
+        self.controller.request_refresh(self.controller.visual_frame)
         self.controller.set_status(f"Renamed shelf to '{name}'.")
 
     def _delete_shelf(self) -> None:
@@ -1061,7 +1188,7 @@ class ShelfFrame(ttk.Frame):
         if not selection:
             return
         shelf_id = int(selection[0])
-        shelf = next((s for s in self.shelves if s["id"] == shelf_id), None)
+        shelf = self._shelves_by_id.get(shelf_id)
         if not shelf:
             return
         if not messagebox.askyesno(
@@ -1076,7 +1203,7 @@ class ShelfFrame(ttk.Frame):
             messagebox.showerror("Error", str(error), parent=self)
             return
         self.refresh()
-        self.controller.visual_frame.refresh()
+        self.controller.request_refresh(self.controller.visual_frame)
         self.controller.set_status(f"Deleted shelf '{shelf['name']}'.")
 
     def _add_row(self) -> None:
@@ -1097,7 +1224,7 @@ class ShelfFrame(ttk.Frame):
             messagebox.showerror("Error", str(error), parent=self)
             return
         self._load_rows(self.selected_shelf_id)
-        self.controller.visual_frame.refresh()
+        self.controller.request_refresh(self.controller.visual_frame)
         self.controller.set_status("Row created.")
 
     def _edit_row(self) -> None:
@@ -1105,19 +1232,19 @@ class ShelfFrame(ttk.Frame):
         if not selection:
             return
         row_id = int(selection[0])
-        row = next((r for r in self.rows if r["id"] == row_id), None)
+        row = self._rows_by_id.get(row_id)
         if not row:
             return
         name = simpledialog.askstring(
             "Row name",
             "Row name:",
-            initialvalue=row.get("name") or "",
+            initialvalue=row["name"] or "",
             parent=self,
         )
         capacity = simpledialog.askinteger(
             "Row capacity",
             "Capacity:",
-            initialvalue=row.get("capacity"),
+            initialvalue=row["capacity"],
             parent=self,
         )
         if not capacity:
@@ -1129,7 +1256,7 @@ class ShelfFrame(ttk.Frame):
             return
         if self.selected_shelf_id:
             self._load_rows(self.selected_shelf_id)
-        self.controller.visual_frame.refresh()
+        self.controller.request_refresh(self.controller.visual_frame)
         self.controller.set_status("Row updated.")
 
     def _delete_row(self) -> None:
@@ -1137,7 +1264,7 @@ class ShelfFrame(ttk.Frame):
         if not selection:
             return
         row_id = int(selection[0])
-        row = next((r for r in self.rows if r["id"] == row_id), None)
+        row = self._rows_by_id.get(row_id)
         if not row:
             return
         if not messagebox.askyesno(
@@ -1153,7 +1280,7 @@ class ShelfFrame(ttk.Frame):
             return
         if self.selected_shelf_id:
             self._load_rows(self.selected_shelf_id)
-        self.controller.visual_frame.refresh()
+        self.controller.request_refresh(self.controller.visual_frame)
         self.controller.set_status("Row deleted.")
 
 
@@ -1175,159 +1302,288 @@ class VisualShelfFrame(ttk.Frame):
         self.h_scroll.grid(row=1, column=0, sticky="ew")
 
         self.canvas.configure(
-            yscrollcommand=self.v_scroll.set, xscrollcommand=self.h_scroll.set
+            yscrollcommand=self._on_yscroll, xscrollcommand=self.h_scroll.set
         )
 
-        self.canvas_images: List[tk.PhotoImage] = []
+        self.x_margin = 40
+        self.y_margin = 40
+        self.slot_width = 90
+        self.slot_height = 130
+        self.slot_gap = 12
+
+        # Layout bands (shelf headers and shelf rows) in top-to-bottom order;
+        # only the ones near the viewport have canvas items at any time.
+        self._bands: List[Dict[str, Any]] = []
+        self._band_tops: List[int] = []
+        self._band_bottoms: List[int] = []
+        self._drawn_bands: Set[int] = set()
+        self._band_images: Dict[int, List[tk.PhotoImage]] = {}
+        self._book_band: Dict[int, int] = {}
+        self._scroll_height = 0
+        self._draw_pending = False
+        self._reveal_queue: List[int] = []
+        self._reveal_after: Optional[str] = None
         self.book_rectangles: Dict[int, int] = {}
         self.highlight_rect: Optional[int] = None
+        self.highlight_book_id: Optional[int] = None
 
         self.canvas.bind("<Button-1>", self._on_click)
 
     def refresh(self) -> None:
         structure = self.controller.store.get_shelf_structure()
         self.canvas.delete("all")
-        self.canvas_images.clear()
+        self._reveal_queue.clear()
+        self._bands = []
+        self._drawn_bands.clear()
+        self._band_images.clear()
+        self._book_band.clear()
         self.book_rectangles.clear()
         self.highlight_rect = None
 
-        x_margin = 40
-        y_margin = 40
-        slot_width = 90
-        slot_height = 130
-        gap = 12
-        y = y_margin
+        x_margin = self.x_margin
+        slot_width = self.slot_width
+        slot_height = self.slot_height
+        gap = self.slot_gap
+        y = self.y_margin
         max_width = 0
 
         for block in structure:
             shelf = block["shelf"]
-            rows = block["rows"]
-            self.canvas.create_text(
-                x_margin,
-                y,
-                anchor="nw",
-                text=shelf["name"],
-                font=("Helvetica", 14, "bold"),
-            )
+            self._bands.append({"kind": "shelf", "top": y, "bottom": y + 30, "name": shelf["name"]})
             y += 30
 
-            for entry in rows:
+            for entry in block["rows"]:
                 row = entry["row"]
-                placements = entry["placements"]
                 capacity = row["capacity"]
-
-                row_name = row.get("name") or f"Row {row['position']}"
-                self.canvas.create_text(
-                    x_margin,
-                    y,
-                    anchor="nw",
-                    text=row_name,
-                    font=("Helvetica", 11, "italic"),
-                )
-                y += 22
-
                 row_width = capacity * slot_width + (capacity - 1) * gap
                 max_width = max(max_width, row_width + x_margin * 2)
 
-                row_top = y
-                row_bottom = y + slot_height + 20
-                self.canvas.create_rectangle(
-                    x_margin - 10,
-                    row_top - 10,
-                    x_margin - 10 + row_width + 20,
-                    row_bottom,
-                    outline="#bfbab0",
-                    width=2,
-                    fill="#ece7e0",
+                row_top = y + 22
+                band_index = len(self._bands)
+                # get_shelf_structure returns these ordered by slot_index.
+                placements = entry["placements"]
+                for placement in placements:
+                    self._book_band[placement["book_id"]] = band_index
+                self._bands.append(
+                    {
+                        "kind": "row",
+                        "top": y,
+                        "bottom": row_top + slot_height + 20,
+                        "name": row.get("name") or f"Row {row['position']}",
+                        "row_top": row_top,
+                        "row_width": row_width,
+                        "capacity": capacity,
+                        "placements": placements,
+                    }
                 )
-
-                placement_map = {p["slot_index"]: p for p in placements}
-                for slot in range(1, capacity + 1):
-                    slot_x = x_margin + (slot - 1) * (slot_width + gap)
-                    slot_rect = self.canvas.create_rectangle(
-                        slot_x,
-                        row_top,
-                        slot_x + slot_width,
-                        row_top + slot_height,
-                        outline="#d4cec4",
-                        width=1,
-                        fill="#ffffff",
-                    )
-
-                    placement = placement_map.get(slot)
-                    if placement:
-                        cover_path_value = placement.get("cover_path")
-                        image = (
-                            load_thumbnail(Path(cover_path_value), (slot_width - 12, slot_height - 20))
-                            if cover_path_value
-                            else None
-                        )
-                        if image:
-                            image_id = self.canvas.create_image(
-                                slot_x + slot_width / 2,
-                                row_top + slot_height / 2,
-                                image=image,
-                            )
-                            self.canvas_images.append(image)
-                            self.canvas.tag_bind(
-                                image_id,
-                                "<Button-1>",
-                                lambda _event, book_id=placement["book_id"]: self._notify_selection(book_id),
-                            )
-                            self.book_rectangles[placement["book_id"]] = slot_rect
-                        else:
-                            title = truncate(placement["title"] or "", 20)
-                            self.canvas.create_text(
-                                slot_x + slot_width / 2,
-                                row_top + slot_height / 2,
-                                text=title,
-                                width=slot_width - 10,
-                            )
-                        self.canvas.tag_bind(
-                            slot_rect,
-                            "<Button-1>",
-                            lambda _event, book_id=placement["book_id"]: self._notify_selection(book_id),
-                        )
-                        self.book_rectangles[placement["book_id"]] = slot_rect
-                    else:
-                        self.canvas.create_text(
-                            slot_x + slot_width / 2,
-                            row_top + slot_height / 2,
-                            text=str(slot),
-                            fill="#b3aea4",
-                        )
-
-                y += slot_height + 40
+                y = row_top + slot_height + 40
 
             y += 30
 
-        scroll_height = max(y, self.winfo_height())
+        self._band_tops = [band["top"] for band in self._bands]
+        self._band_bottoms = [band["bottom"] for band in self._bands]
+        self._scroll_height = max(y, self.winfo_height())
         scroll_width = max(max_width, self.winfo_width())
-        self.canvas.configure(scrollregion=(0, 0, scroll_width, scroll_height))
+        self.canvas.configure(scrollregion=(0, 0, scroll_width, self._scroll_height))
+        self._draw_visible()
+
+    def _on_yscroll(self, first: str, last: str) -> None:
+        self.v_scroll.set(first, last)
+        if not self._draw_pending:
+            self._draw_pending = True
+            self.after_idle(self._draw_visible)
+
+    def _draw_visible(self) -> None:
+        """Create items for bands near the viewport and drop distant ones."""
+        self._draw_pending = False
+        view_top = self.canvas.canvasy(0)
+        view_height = max(self.canvas.winfo_height(), 600)
+        view_bottom = view_top + view_height
+        # Draw one screen ahead, but keep items for two, so small scrolls back
+        # and forth do not recreate the same bands.
+        draw_top, draw_bottom = view_top - view_height, view_bottom + view_height
+        keep_top, keep_bottom = draw_top - view_height, draw_bottom + view_height
+
+        for index in list(self._drawn_bands):
+            band = self._bands[index]
+            if band["bottom"] < keep_top or band["top"] > keep_bottom:
+                self._forget_band(index)
+
+        # Bands are laid out top to bottom without overlap, so both edge
+        # lists are sorted and the visible slice is two bisections away.
+        first = bisect_left(self._band_bottoms, draw_top)
+        last = bisect_right(self._band_tops, draw_bottom)
+        # What is on screen is drawn now; the margin above and below is
+        # revealed one band per idle callback so input is handled in between.
+        visible_first = bisect_left(self._band_bottoms, view_top)
+        visible_last = bisect_right(self._band_tops, view_bottom)
+        for index in range(visible_first, visible_last):
+            if index not in self._drawn_bands:
+                self._draw_band(index, self._bands[index])
+        self._reveal_queue = [
+            index
+            for index in [*range(visible_last, last), *range(visible_first - 1, first - 1, -1)]
+            if index not in self._drawn_bands
+        ]
+        if self._reveal_queue and self._reveal_after is None:
+            self._reveal_after = self.after_idle(self._reveal_step)
+
+    def _reveal_step(self) -> None:
+        self._reveal_after = None
+        while self._reveal_queue:
+            index = self._reveal_queue.pop(0)
+            if index not in self._drawn_bands:
+                self._draw_band(index, self._bands[index])
+                break
+        if self._reveal_queue:
+            self._reveal_after = self.after_idle(self._reveal_step)
+
+    def _forget_band(self, index: int) -> None:
+        self.canvas.delete(f"band{index}")
+        self._drawn_bands.discard(index)
+        self._band_images.pop(index, None)
+        for placement in self._bands[index].get("placements", ()):
+            rect_id = self.book_rectangles.pop(placement["book_id"], None)
+            if rect_id is not None and rect_id == self.highlight_rect:
+                self.highlight_rect = None
+
+    def _draw_band(self, index: int, band: Dict[str, Any]) -> None:
+        self._drawn_bands.add(index)
+        tag = f"band{index}"
+        x_margin = self.x_margin
+        if band["kind"] == "shelf":
+            self.canvas.create_text(
+                x_margin,
+                band["top"],
+                anchor="nw",
+                text=band["name"],
+                font=("Helvetica", 14, "bold"),
+                tags=(tag,),
+            )
+            return
+
+        slot_width = self.slot_width
+        slot_height = self.slot_height
+        gap = self.slot_gap
+        row_top = band["row_top"]
+        self.canvas.create_text(
+            x_margin,
+            band["top"],
+            anchor="nw",
+            text=band["name"],
+            font=("Helvetica", 11, "italic"),
+            tags=(tag,),
+        )
+        self.canvas.create_rectangle(
+            x_margin - 10,
+            row_top - 10,
+            x_margin - 10 + band["row_width"] + 20,
+            band["bottom"],
+            outline="#bfbab0",
+            width=2,
+            fill="#ece7e0",
+            tags=(tag,),
+        )
+
+        canvas = self.canvas
+        tags = (tag,)
+        pitch = slot_width + gap
+        center_dx = slot_width / 2
+        center_y = row_top + slot_height / 2
+        capacity = band["capacity"]
+        slot_rects = [
+            canvas.create_rectangle(
+                x_margin + (slot - 1) * pitch,
+                row_top,
+                x_margin + (slot - 1) * pitch + slot_width,
+                row_top + slot_height,
+                outline="#d4cec4",
+                width=1,
+                fill="#ffffff",
+                tags=tags,
+            )
+            for slot in range(1, capacity + 1)
+        ]
+
+        images: List[tk.PhotoImage] = []
+        thumb_size = (slot_width - 12, slot_height - 20)
+        filled_slots: Set[int] = set()
+        for placement in band["placements"]:
+            slot = placement["slot_index"]
+            if not 1 <= slot <= capacity:
+                continue
+            filled_slots.add(slot)
+            slot_rect = slot_rects[slot - 1]
+            center_x = x_margin + (slot - 1) * pitch + center_dx
+            book_id = placement["book_id"]
+            # _on_click recovers the book from this tag on whichever item is hit.
+            book_tags = (tag, f"book:{book_id}")
+            canvas.addtag_withtag(book_tags[1], slot_rect)
+            cover_path_value = placement.get("cover_path")
+            image = load_thumbnail(Path(cover_path_value), thumb_size) if cover_path_value else None
+            if image:
+                canvas.create_image(center_x, center_y, image=image, tags=book_tags)
+                images.append(image)
+            else:
+                canvas.create_text(
+                    center_x,
+                    center_y,
+                    text=truncate(placement["title"] or "", 20),
+                    width=slot_width - 10,
+                    tags=book_tags,
+                )
+            self.book_rectangles[book_id] = slot_rect
+            if book_id == self.highlight_book_id:
+                canvas.itemconfigure(slot_rect, outline="#c32e26", width=3)
+                self.highlight_rect = slot_rect
+
+        for slot in range(1, capacity + 1):
+            if slot not in filled_slots:
+                canvas.create_text(
+                    x_margin + (slot - 1) * pitch + center_dx,
+                    center_y,
+                    text=str(slot),
+                    fill="#b3aea4",
+                    tags=tags,
+                )
+        self._band_images[index] = images
 
     def _on_click(self, event: tk.Event) -> None:
-        item = self.canvas.find_closest(event.x, event.y)
-        if not item:
-            return
-        for book_id, rect in self.book_rectangles.items():
-            if rect == item[0]:
-                self._notify_selection(book_id)
-                return
+        x = self.canvas.canvasx(event.x)
+        y = self.canvas.canvasy(event.y)
+        for item in reversed(self.canvas.find_overlapping(x, y, x, y)):
+            for tag in self.canvas.gettags(item):
+                if tag.startswith("book:"):
+                    self._notify_selection(int(tag[5:]))
+                    return
 
     def _notify_selection(self, book_id: int) -> None:
         self.highlight_book(book_id)
         self.controller.focus_on_book(book_id)
 
     def highlight_book(self, book_id: Optional[int]) -> None:
+        # A shelf click highlights the book, then selects it in the inventory,
+        # whose selection handler asks for the same highlight again.
+        if book_id == self.highlight_book_id and (book_id is None or self.highlight_rect):
+            return
         if self.highlight_rect:
             self.canvas.itemconfigure(self.highlight_rect, outline="#d4cec4", width=1)
             self.highlight_rect = None
+        self.highlight_book_id = book_id
 
-        if book_id and book_id in self.book_rectangles:
-            rect_id = self.book_rectangles[book_id]
+        band_index = self._book_band.get(book_id) if book_id else None
+        if band_index is None:
+            return
+        band = self._bands[band_index]
+        view_top = self.canvas.canvasy(0)
+        view_bottom = view_top + self.canvas.winfo_height()
+        if (band["top"] < view_top or band["bottom"] > view_bottom) and self._scroll_height:
+            self.canvas.yview_moveto(max(band["top"] - 20, 0) / self._scroll_height)
+            self._draw_visible()
+        rect_id = self.book_rectangles.get(book_id)
+        if rect_id is not None:
             self.canvas.itemconfigure(rect_id, outline="#c32e26", width=3)
             self.highlight_rect = rect_id
-            self.canvas.see(rect_id)
 
 
 # --------------------------------------------------------------------------- #
@@ -1343,7 +1599,12 @@ class PlacementDialog(tk.Toplevel):
         self.grab_set()
 
         self.shelves = self.controller.store.list_shelves()
-        self.rows = self.controller.store.list_rows_with_shelves()
+        self._shelf_by_name: Dict[str, sqlite3.Row] = {}
+        for shelf in self.shelves:
+            self._shelf_by_name.setdefault(shelf["name"], shelf)
+        self._rows_by_label: Dict[str, sqlite3.Row] = {}
+        # Rows per shelf id; nothing else edits rows while the dialog is modal.
+        self._rows_cache: Dict[int, List[sqlite3.Row]] = {}
 
         ttk.Label(self, text="Shelf:").grid(row=0, column=0, sticky="w", padx=12, pady=(12, 4))
         self.shelf_var = tk.StringVar()
@@ -1380,33 +1641,30 @@ class PlacementDialog(tk.Toplevel):
             self.destroy()
 
     def _populate_rows(self) -> None:
-        shelf_name = self.shelf_var.get()
-        shelf = next((s for s in self.shelves if s["name"] == shelf_name), None)
+        shelf = self._shelf_by_name.get(self.shelf_var.get())
         if not shelf:
             self.row_combo.configure(values=[])
             return
-        rows = self.controller.store.list_rows(shelf["id"])
+        rows = self._rows_cache.get(shelf["id"])
+        if rows is None:
+            rows = self._rows_cache[shelf["id"]] = self.controller.store.list_rows(shelf["id"])
         self.active_rows = rows
-        row_labels = [
-            (row.get("name") or f"Row {row['position']}", row["id"]) for row in rows
-        ]
-        self.row_combo.configure(values=[label for label, _ in row_labels])
-        if row_labels:
+        # Keyed by the label shown in the combobox; the first row wins on
+        # duplicate names, as the old linear search did.
+        self._rows_by_label = {}
+        for row in rows:
+            self._rows_by_label.setdefault(row["name"] or f"Row {row['position']}", row)
+        self.row_combo.configure(values=list(self._rows_by_label))
+        if rows:
             self.row_combo.current(0)
         self._update_slot_range()
 
     def _update_slot_range(self) -> None:
         if not hasattr(self, "active_rows"):
             return
-        row_label = self.row_var.get()
-        row = next(
-            (
-                r
-                for r in self.active_rows
-                if (r.get("name") or f"Row {r['position']}") == row_label
-            ),
-            self.active_rows[0] if self.active_rows else None,
-        )
+        row = self._rows_by_label.get(self.row_var.get())
+        if row is None and self.active_rows:
+            row = self.active_rows[0]
         if not row:
             return
         capacity = row["capacity"]
@@ -1419,18 +1677,12 @@ class PlacementDialog(tk.Toplevel):
         if not shelf_name or not row_name:
             messagebox.showerror("Placement", "Select shelf and row.", parent=self)
             return
-        shelf = next((s for s in self.shelves if s["name"] == shelf_name), None)
+        shelf = self._shelf_by_name.get(shelf_name)
         if not shelf:
             messagebox.showerror("Placement", "Invalid shelf selection.", parent=self)
             return
-        row = next(
-            (
-                r
-                for r in self.controller.store.list_rows(shelf["id"])
-                if (r.get("name") or f"Row {r['position']}") == row_name
-            ),
-            None,
-        )
+        # _populate_rows loaded this shelf's rows when it was selected.
+        row = self._rows_by_label.get(row_name)
         if not row:
             messagebox.showerror("Placement", "Row not found.", parent=self)
             return
@@ -1441,7 +1693,7 @@ class PlacementDialog(tk.Toplevel):
             messagebox.showerror("Placement error", str(error), parent=self)
             return
         self.controller.set_status("Placement saved.")
-        self.controller.after(0, self.controller.refresh_all)
+        self.controller.refresh_all()
         self.destroy()
 
 
@@ -1456,6 +1708,13 @@ class MainApplication(tk.Tk):
         self.minsize(1100, 720)
 
         self.store = InventoryStore(db_path)
+        # Widget path -> refresh callable, and the paths whose data changed
+        # while their tab was hidden; those refresh when next selected.
+        self._refreshers: Dict[str, Callable[[], None]] = {}
+        self._stale_tabs: Set[str] = set()
+        self._pending_refreshes: Dict[str, str] = {}
+        # Read once; every frame paints its flat widgets with it.
+        self.background = self.cget("background")
         self.status_var = tk.StringVar(value="Ready.")
 
         self._build_ui()
@@ -1463,6 +1722,7 @@ class MainApplication(tk.Tk):
     def _build_ui(self) -> None:
         notebook = ttk.Notebook(self)
         notebook.pack(fill="both", expand=True)
+        self.notebook = notebook
 
         self.search_frame = SearchFrame(notebook, self)
         notebook.add(self.search_frame, text="Search & Add")
@@ -1479,6 +1739,13 @@ class MainApplication(tk.Tk):
         status_bar = ttk.Label(self, textvariable=self.status_var, anchor="w", padding=(8, 4))
         status_bar.pack(side="bottom", fill="x")
 
+        self._refreshers = {
+            str(self.inventory_frame): self.inventory_frame.refresh_books,
+            str(self.shelf_frame): self.shelf_frame.refresh,
+            str(self.visual_frame): self.visual_frame.refresh,
+        }
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
         self.protocol("WM_DELETE_WINDOW", self.on_close)
         self.refresh_all()
 
@@ -1487,9 +1754,31 @@ class MainApplication(tk.Tk):
         self.status_var.set(message)
 
     def refresh_all(self) -> None:
-        self.inventory_frame.refresh_books()
-        self.shelf_frame.refresh()
-        self.visual_frame.refresh()
+        self.request_refresh(self.inventory_frame)
+        self.request_refresh(self.shelf_frame)
+        self.request_refresh(self.visual_frame)
+
+    def request_refresh(self, frame: ttk.Frame) -> None:
+        """Refresh ``frame`` once idle if its tab is showing, else when it is next shown.
+
+        Requests made before the refresh runs are coalesced into it, so a burst
+        of edits costs a single rebuild.
+        """
+        path = str(frame)
+        if str(self.notebook.select()) != path:
+            self._stale_tabs.add(path)
+        elif path not in self._pending_refreshes:
+            self._pending_refreshes[path] = self.after_idle(self._run_refresh, path)
+
+    def _run_refresh(self, path: str) -> None:
+        self._pending_refreshes.pop(path, None)
+        self._stale_tabs.discard(path)
+        self._refreshers[path]()
+
+    def _on_tab_changed(self, _event: tk.Event) -> None:
+        path = str(self.notebook.select())
+        if path in self._stale_tabs and path not in self._pending_refreshes:
+            self._run_refresh(path)
 
     def add_book_from_doc(self, doc: Dict) -> None:
         record = build_record(doc)
@@ -1499,10 +1788,15 @@ class MainApplication(tk.Tk):
             or record.get("title")
             or "cover"
         )
-        cover_path = fetch_and_cache_cover(record.get("cover_url"), identifier)
-        book_id, created = self.store.add_or_update_book(
-            record, cover_path=Path(cover_path) if cover_path else None
-        )
+        # Save the record now; the cover is downloaded in the background and
+        # attached by _on_cover_ready so the window never waits on the network.
+        book_id, created = self.store.add_or_update_book(record)
+        if record.get("cover_url"):
+            threading.Thread(
+                target=self._fetch_cover_background,
+                args=(book_id, record["cover_url"], identifier),
+                daemon=True,
+            ).start()
         self.refresh_all()
         if created:
             self.set_status(f"Added '{record['title']}' to the inventory.")
@@ -1516,6 +1810,15 @@ class MainApplication(tk.Tk):
         if should_place:
             self.open_placement_dialog(book_id, record["title"])
 
+    def _fetch_cover_background(self, book_id: int, cover_url: str, identifier: str) -> None:
+        cover_path = fetch_and_cache_cover(cover_url, identifier)
+        if cover_path:
+            self.after(0, self._on_cover_ready, book_id, cover_path)
+
+    def _on_cover_ready(self, book_id: int, cover_path: Path) -> None:
+        self.store.update_cover_path(book_id, cover_path)
+        self.refresh_all()
+
     def open_placement_dialog(self, book_id: int, title: Optional[str] = None) -> None:
         book = self.store.get_book(book_id)
         if not book:
@@ -2,13 +2,60 @@ from __future__ import annotations
 
 import re
 from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from datetime import timedelta
+from pathlib import Path
 from threading import RLock
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 import requests
 
-from api import COVER_URL_TEMPLATE
+try:  # diskcache keeps enriched records across restarts; memory-only otherwise.
+    import diskcache
+except ImportError:  # pragma: no cover - optional accelerator
+    diskcache = None
+
+try:  # orjson decodes the source payloads several times faster than json.
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional accelerator
+    from json import loads as _json_loads
+
+from api import COVER_URL_TEMPLATE, get_session, prepare_session
+
+_ISBN_RE = re.compile(r"[0-9Xx]{10,13}")
+_YEAR_RE = re.compile(r"[0-9]{4}")
+
+# Source lookups are kept on disk (when requests-cache is installed) so a
+# restart does not re-query every book.
+HTTP_CACHE_PATH = Path.home() / ".moms_books" / "http_cache.sqlite"
+HTTP_CACHE_TTL = timedelta(days=7)
+_http_session: Optional[requests.Session] = None
+_http_session_lock = RLock()
+
+
+def _get_session() -> requests.Session:
+    """Return the session used for LoC, Internet Archive and Google Books."""
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                try:  # requests-cache persists responses in SQLite.
+                    from requests_cache import CachedSession
+                except ImportError:  # pragma: no cover - optional accelerator
+                    _http_session = get_session()
+                else:
+                    HTTP_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+                    _http_session = prepare_session(
+                        CachedSession(
+                            str(HTTP_CACHE_PATH),
+                            backend="sqlite",
+                            expire_after=HTTP_CACHE_TTL,
+                            allowable_codes=(200,),
+                            stale_if_error=True,
+                        )
+                    )
+    return _http_session
 
 
 @dataclass
@@ -24,21 +71,32 @@ class NormalizedBook:
     subjects: List[str] = field(default_factory=list)
     openlibrary_key: Optional[str] = None
     raw: Dict[str, Any] = field(default_factory=dict)
+    # Lowercased, stripped title and publisher, computed once at construction
+    # for clustering and cache keys.
+    title_norm: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    publisher_norm: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.title_norm = _normalize_text(self.title)
+        self.publisher_norm = _normalize_text(self.publisher)
+
+
+def _normalize_text(value: Optional[str]) -> Optional[str]:
+    return value.strip().lower() if value else None
 
 
 def _normalize_isbn(*values: Optional[str]) -> Set[str]:
-    isbn_re = re.compile(r"[0-9Xx]{10,13}")
     results: Set[str] = set()
     for value in values:
         if not value:
             continue
         if isinstance(value, str):
-            matches = isbn_re.findall(value)
+            matches = _ISBN_RE.findall(value)
             for match in matches:
                 results.add(match.upper())
         elif isinstance(value, Iterable):
             for item in value:
-                for match in isbn_re.findall(str(item)):
+                for match in _ISBN_RE.findall(str(item)):
                     results.add(match.upper())
     return results
 
@@ -60,6 +118,9 @@ def normalize_openlibrary(doc: Dict[str, Any]) -> NormalizedBook:
     subjects = doc.get("subject") or []
     if isinstance(subjects, str):
         subjects = [subjects]
+    if not subjects and isinstance(doc.get("subjects"), str):
+        # Stored records keep subjects as one comma-joined column.
+        subjects = [part.strip() for part in doc["subjects"].split(",")]
     year = doc.get("first_publish_year") or doc.get("publish_year")
     if isinstance(year, list):
         year = year[0]
@@ -97,15 +158,15 @@ def fetch_loc_books(record: NormalizedBook) -> List[NormalizedBook]:
     results: List[NormalizedBook] = []
     for query in queries:
         try:
-            response = requests.get(
+            response = _get_session().get(
                 "https://www.loc.gov/books/",
-                params={"q": query, "fo": "json"},
+                params={"q": query, "fo": "json", "at": "results"},
                 timeout=8,
             )
             response.raise_for_status()
         except requests.RequestException:
             continue
-        data = response.json()
+        data = _json_loads(response.content)
         for item in data.get("results", []):
             title = item.get("title")
             authors = item.get("contributor") or item.get("creator") or []
@@ -124,7 +185,7 @@ def fetch_loc_books(record: NormalizedBook) -> List[NormalizedBook]:
                 publishers = [publishers]
             year = item.get("date") or item.get("published")
             try:
-                year_int = int(re.findall(r"\d{4}", str(year))[0]) if year else None
+                year_int = int(_YEAR_RE.findall(str(year))[0]) if year else None
             except (ValueError, IndexError):
                 year_int = None
             image_urls = item.get("image_url") or []
@@ -160,7 +221,7 @@ def fetch_ia_books(record: NormalizedBook) -> List[NormalizedBook]:
         return []
     query = " AND ".join(query_parts)
     try:
-        response = requests.get(
+        response = _get_session().get(
             "https://archive.org/advancedsearch.php",
             params={
                 "q": query,
@@ -173,7 +234,7 @@ def fetch_ia_books(record: NormalizedBook) -> List[NormalizedBook]:
         response.raise_for_status()
     except requests.RequestException:
         return []
-    data = response.json()
+    data = _json_loads(response.content)
     docs = data.get("response", {}).get("docs", [])
     results: List[NormalizedBook] = []
     for doc in docs:
@@ -203,12 +264,20 @@ def fetch_ia_books(record: NormalizedBook) -> List[NormalizedBook]:
     return results
 
 
+# Partial response: Google omits saleInfo, accessInfo and every volumeInfo
+# field the parser below does not read.
+_GOOGLE_FIELDS = (
+    "items(id,volumeInfo(title,authors,publisher,publishedDate,"
+    "industryIdentifiers,imageLinks,description,categories))"
+)
+
+
 def fetch_google_books(record: NormalizedBook) -> List[NormalizedBook]:
     """Fetch candidate matches from the Google Books public API (no key required)."""
     queries: List[str] = []
     if record.isbn_set:
-        for isbn in record.isbn_set:
-            queries.append(f"isbn:{isbn}")
+        # One request covers every ISBN; sorted so repeat lookups hit the HTTP cache.
+        queries.append(" OR ".join(f"isbn:{isbn}" for isbn in sorted(record.isbn_set)))
     if record.title and record.authors:
         queries.append(f'intitle:"{record.title}" inauthor:"{record.authors[0]}"')
     elif record.title:
@@ -219,16 +288,16 @@ def fetch_google_books(record: NormalizedBook) -> List[NormalizedBook]:
     results: List[NormalizedBook] = []
     for query in queries:
         try:
-            response = requests.get(
+            response = _get_session().get(
                 "https://www.googleapis.com/books/v1/volumes",
-                params={"q": query, "maxResults": "5"},
+                params={"q": query, "maxResults": "5", "fields": _GOOGLE_FIELDS},
                 timeout=8,
             )
             response.raise_for_status()
         except requests.RequestException:
             continue
 
-        data = response.json() or {}
+        data = _json_loads(response.content) or {}
         items = data.get("items") or []
         for item in items:
             info = item.get("volumeInfo") or {}
@@ -238,7 +307,7 @@ def fetch_google_books(record: NormalizedBook) -> List[NormalizedBook]:
             published = info.get("publishedDate")
             year_int: Optional[int] = None
             if isinstance(published, str):
-                match = re.search(r"\d{4}", published)
+                match = _YEAR_RE.search(published)
                 if match:
                     try:
                         year_int = int(match.group(0))
@@ -284,10 +353,13 @@ def fetch_google_books(record: NormalizedBook) -> List[NormalizedBook]:
 
 
 def normalized_key(book: NormalizedBook) -> Tuple[Optional[str], Optional[str], Optional[int]]:
-    title = (book.title or "").strip().lower() if book.title else None
-    publisher = (book.publisher or "").strip().lower() if book.publisher else None
-    year = book.year
-    return title, publisher, year
+    return book.title_norm, book.publisher_norm, book.year
+
+
+def _raw_ref(raw: Dict[str, Any]) -> Optional[str]:
+    """Identify a source payload (OL key, LoC/Google id, IA identifier) without keeping it."""
+    ref = raw.get("key") or raw.get("id") or raw.get("identifier")
+    return str(ref) if ref else None
 
 
 def merge_books(records: List[NormalizedBook]) -> NormalizedBook:
@@ -307,17 +379,23 @@ def merge_books(records: List[NormalizedBook]) -> NormalizedBook:
         openlibrary_key=base.openlibrary_key,
         raw={"sources": []},
     )
+    # Membership checks go through sets; the lists keep first-seen order.
+    seen_authors = set(merged.authors)
+    seen_subjects = set(merged.subjects)
     for record in records:
-        merged.raw["sources"].append({"source": record.source, "raw": record.raw})
+        merged.raw["sources"].append({"source": record.source, "ref": _raw_ref(record.raw)})
         merged.isbn_set.update(record.isbn_set)
         if not merged.title and record.title:
             merged.title = record.title
+            merged.title_norm = record.title_norm
         if record.authors:
             for author in record.authors:
-                if author and author not in merged.authors:
+                if author and author not in seen_authors:
                     merged.authors.append(author)
+                    seen_authors.add(author)
         if not merged.publisher and record.publisher:
             merged.publisher = record.publisher
+            merged.publisher_norm = record.publisher_norm
         if not merged.year and record.year:
             merged.year = record.year
         if not merged.cover_url and record.cover_url:
@@ -325,8 +403,9 @@ def merge_books(records: List[NormalizedBook]) -> NormalizedBook:
         if not merged.description and record.description:
             merged.description = record.description
         for subject in record.subjects:
-            if subject and subject not in merged.subjects:
+            if subject and subject not in seen_subjects:
                 merged.subjects.append(subject)
+                seen_subjects.add(subject)
         if not merged.openlibrary_key and record.openlibrary_key:
             merged.openlibrary_key = record.openlibrary_key
     return merged
@@ -336,56 +415,78 @@ def cluster_records(records: List[NormalizedBook]) -> List[List[NormalizedBook]]
     if not records:
         return []
 
-    parent = list(range(len(records)))
-
-    def find(index: int) -> int:
-        while parent[index] != index:
-            parent[index] = parent[parent[index]]
-            index = parent[index]
-        return index
-
-    def union(a: int, b: int) -> None:
-        root_a = find(a)
-        root_b = find(b)
-        if root_a == root_b:
-            return
-        parent[root_b] = root_a
-
-    key_map: Dict[str, List[int]] = defaultdict(list)
+    key_map: Dict[Tuple[Any, ...], List[int]] = defaultdict(list)
+    record_keys: List[List[Tuple[Any, ...]]] = []
 
     for idx, record in enumerate(records):
+        keys: List[Tuple[Any, ...]] = []
         if record.isbn_set:
             for isbn in record.isbn_set:
-                key_map[f"isbn:{isbn}"].append(idx)
+                keys.append(("isbn", isbn))
         title, publisher, year = normalized_key(record)
         if title and publisher and year:
-            key_map[f"tp:{title}|{publisher}|{year}"].append(idx)
+            keys.append(("tp", title, publisher, year))
         if title and year:
-            key_map[f"ty:{title}|{year}"].append(idx)
+            keys.append(("ty", title, year))
         if title:
-            key_map[f"title:{title}"].append(idx)
-
-    for indexes in key_map.values():
-        if len(indexes) < 2:
+            keys.append(("title", title))
+        for key in keys:
+            key_map[key].append(idx)
+        record_keys.append(keys)
+
+    # Records sharing any key are one book: walk the record/key graph and
+    # collect each connected component, in order of its first record.
+    visited = [False] * len(records)
+    groups: List[List[NormalizedBook]] = []
+    for start in range(len(records)):
+        if visited[start]:
             continue
-        anchor = indexes[0]
-        for other in indexes[1:]:
-            union(anchor, other)
-
-    groups: Dict[int, List[NormalizedBook]] = defaultdict(list)
-    for idx, record in enumerate(records):
-        groups[find(idx)].append(record)
-
-    return list(groups.values())
+        visited[start] = True
+        component = [start]
+        stack = [start]
+        while stack:
+            for key in record_keys[stack.pop()]:
+                for other in key_map[key]:
+                    if not visited[other]:
+                        visited[other] = True
+                        component.append(other)
+                        stack.append(other)
+        component.sort()
+        groups.append([records[idx] for idx in component])
+
+    return groups
+
+
+def _is_complete(book: NormalizedBook) -> bool:
+    """True when no other source could fill in anything the caller uses."""
+    return bool(
+        book.isbn_set
+        and book.cover_url
+        and book.publisher
+        and book.year
+        and book.description
+        and book.subjects
+    )
 
 
 def collect_enrichment(record: Dict[str, Any], *, base: Optional[NormalizedBook] = None) -> NormalizedBook:
     if base is None:
         base = normalize_openlibrary(record)
-    loc_matches = fetch_loc_books(base)
-    ia_matches = fetch_ia_books(base)
-    google_matches = fetch_google_books(base)
-    clusters = cluster_records([base, *loc_matches, *ia_matches, *google_matches])
+    if _is_complete(base):
+        return base
+    # The three lookups are independent network round trips; run them side by
+    # side and read the results back in a fixed order so clustering stays stable.
+    with ThreadPoolExecutor(max_workers=3, thread_name_prefix="enrich") as pool:
+        futures = [
+            pool.submit(fetch, base)
+            for fetch in (fetch_loc_books, fetch_ia_books, fetch_google_books)
+        ]
+        loc_matches, ia_matches, google_matches = (future.result() for future in futures)
+    candidates = [base, *loc_matches, *ia_matches, *google_matches]
+    if len(candidates) == 1:
+        # No source found anything, so there is nothing to cluster or merge.
+        return base
+    clusters = cluster_records(candidates)
     merged_clusters = [merge_books(cluster) for cluster in clusters]
     merged_clusters.sort(
         key=lambda item: (
@@ -398,28 +499,70 @@ def collect_enrichment(record: Dict[str, Any], *, base: Optional[NormalizedBook]
 
 
 _CACHE_CAPACITY = 128
-_enrichment_cache: OrderedDict[str, NormalizedBook] = OrderedDict()
+_enrichment_cache: OrderedDict[Tuple[Any, ...], NormalizedBook] = OrderedDict()
 _cache_lock = RLock()
 
+ENRICHMENT_CACHE_DIR = Path.home() / ".moms_books" / "enrichment_cache"
+_DISK_CACHE_SIZE = 64 << 20
+_DISK_CACHE_TTL = 7 * 24 * 60 * 60
+# Bump when NormalizedBook changes shape so old pickles are ignored.
+_DISK_CACHE_VERSION = 3
+_disk_cache: Optional["diskcache.Cache"] = None
+
+
+def set_enrichment_cache_dir(path: Path) -> None:
+    """Point the on-disk enrichment cache at ``path`` (closing any open cache)."""
+    global ENRICHMENT_CACHE_DIR, _disk_cache
+    with _cache_lock:
+        if _disk_cache is not None:
+            _disk_cache.close()
+            _disk_cache = None
+        ENRICHMENT_CACHE_DIR = Path(path)
+        _enrichment_cache.clear()
+
+
+def _get_disk_cache() -> Optional["diskcache.Cache"]:
+    global _disk_cache
+    if diskcache is None:
+        return None
+    if _disk_cache is None:
+        with _cache_lock:
+            if _disk_cache is None:
+                _disk_cache = diskcache.Cache(
+                    str(ENRICHMENT_CACHE_DIR),
+                    size_limit=_DISK_CACHE_SIZE,
+                    eviction_policy="least-recently-used",
+                )
+    return _disk_cache
+
 
-def _cache_key_from_book(book: NormalizedBook) -> Optional[str]:
+def _cache_key_from_book(book: NormalizedBook) -> Optional[Tuple[Any, ...]]:
     if book.openlibrary_key:
-        return f"ol:{book.openlibrary_key}"
+        return ("ol", book.openlibrary_key)
     if book.isbn_set:
-        return f"isbn:{sorted(book.isbn_set)[0]}"
+        return ("isbn", min(book.isbn_set))
     title, publisher, year = normalized_key(book)
     if title and publisher and year:
-        return f"tp:{title}|{publisher}|{year}"
+        return ("tp", title, publisher, year)
     if title and year:
-        return f"ty:{title}|{year}"
+        return ("ty", title, year)
     if title:
-        return f"title:{title}"
+        return ("title", title)
     return None
 
 
+def _remember(cache_key: Tuple[Any, ...], book: NormalizedBook) -> None:
+    with _cache_lock:
+        _enrichment_cache[cache_key] = book
+        _enrichment_cache.move_to_end(cache_key)
+        if len(_enrichment_cache) > _CACHE_CAPACITY:
+            _enrichment_cache.popitem(last=False)
+
+
 def get_enriched_record(record: Dict[str, Any]) -> NormalizedBook:
     base = normalize_openlibrary(record)
     cache_key = _cache_key_from_book(base)
+    disk = _get_disk_cache() if cache_key else None
 
     if cache_key:
         with _cache_lock:
@@ -427,14 +570,20 @@ def get_enriched_record(record: Dict[str, Any]) -> NormalizedBook:
             if cached:
                 _enrichment_cache.move_to_end(cache_key)
                 return cached
+        if disk is not None:
+            cached = disk.get((_DISK_CACHE_VERSION, cache_key))
+            if cached is not None:
+                _remember(cache_key, cached)
+                return cached
 
     enriched = collect_enrichment(record, base=base)
 
     if cache_key:
-        with _cache_lock:
-            _enrichment_cache[cache_key] = enriched
-            if len(_enrichment_cache) > _CACHE_CAPACITY:
-                _enrichment_cache.popitem(last=False)
+        _remember(cache_key, enriched)
+        # collect_enrichment hands back the base record itself when no source
+        # answered (or none was needed); fetchers swallow network errors, so
+        # persisting that would block enrichment for a week after one bad run.
+        if disk is not None and enriched is not base:
+            disk.set((_DISK_CACHE_VERSION, cache_key), enriched, expire=_DISK_CACHE_TTL)
 
     return enriched
-
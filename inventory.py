@@ -1,16 +1,85 @@
 from __future__ import annotations
 
+import re
 import sqlite3
 import threading
+import weakref
 from dataclasses import dataclass
+from itertools import chain, groupby
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from api import DEFAULT_COLUMNS
 
 APP_DIR = Path.home() / ".moms_books"
 APP_DIR.mkdir(parents=True, exist_ok=True)
 DEFAULT_DB_PATH = APP_DIR / "library.db"
+SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+# sqlite3 caches prepared statements by SQL text; queries that were assembled
+# per call or repeated across methods are built once here so they always hit.
+STATEMENT_CACHE_SIZE = 256
+
+_BOOK_COLUMNS = DEFAULT_COLUMNS + ["cover_path"]
+_BOOK_INSERT = (
+    f"INSERT INTO books ({', '.join(_BOOK_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in _BOOK_COLUMNS)})"
+)
+_BOOK_SELECT = """
+    SELECT
+        b.*,
+        p.shelf_row_id,
+        p.slot_index,
+        sr.name AS row_name,
+        sr.position AS row_position,
+        sr.capacity AS row_capacity,
+        s.id AS shelf_id,
+        s.name AS shelf_name
+    FROM books b
+    LEFT JOIN placements p ON p.book_id = b.id
+    LEFT JOIN shelf_rows sr ON sr.id = p.shelf_row_id
+    LEFT JOIN shelves s ON s.id = sr.shelf_id
+"""
+_BOOK_BY_ID = _BOOK_SELECT + "WHERE b.id = ?"
+
+# Full-text index over the searchable book columns. It is an external-content
+# table, so the text lives only in books and triggers keep the index in step.
+_FTS_SCHEMA = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS books_fts USING fts5(
+        title, authors, publisher, isbn,
+        content='books', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    );
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS books_fts_insert AFTER INSERT ON books BEGIN
+        INSERT INTO books_fts (rowid, title, authors, publisher, isbn)
+        VALUES (new.id, new.title, new.authors, new.publisher, new.isbn);
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS books_fts_delete AFTER DELETE ON books BEGIN
+        INSERT INTO books_fts (books_fts, rowid, title, authors, publisher, isbn)
+        VALUES ('delete', old.id, old.title, old.authors, old.publisher, old.isbn);
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS books_fts_update
+    AFTER UPDATE OF title, authors, publisher, isbn ON books BEGIN
+        INSERT INTO books_fts (books_fts, rowid, title, authors, publisher, isbn)
+        VALUES ('delete', old.id, old.title, old.authors, old.publisher, old.isbn);
+        INSERT INTO books_fts (rowid, title, authors, publisher, isbn)
+        VALUES (new.id, new.title, new.authors, new.publisher, new.isbn);
+    END;
+    """,
+)
+_SEARCH_TOKEN_RE = re.compile(r"\w+")
+_BOOK_FTS_SEARCH = (
+    _BOOK_SELECT
+    + "WHERE b.id IN (SELECT rowid FROM books_fts WHERE books_fts MATCH ?)"
+    + " ORDER BY b.title COLLATE NOCASE;"
+)
 
 
 @dataclass
@@ -23,19 +92,81 @@ class PlacementInfo:
     slot_index: int
 
 
+class _ReaderHolder:
+    """Thread-local box for a reader connection, so its lifetime can be tracked."""
+
+    __slots__ = ("conn", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+
+
+def _release_reader(
+    readers: Set[sqlite3.Connection], lock: threading.Lock, conn: sqlite3.Connection
+) -> None:
+    with lock:
+        readers.discard(conn)
+    conn.close()
+
+
 class InventoryStore:
     """SQLite-backed store for the local library inventory."""
 
-    def __init__(self, db_path: Optional[Path] = None):
+    def __init__(self, db_path: Optional[Path] = None, *, synchronous: str = "NORMAL"):
+        """Open (or create) the inventory database.
+
+        ``synchronous`` is passed to ``PRAGMA synchronous``; NORMAL is durable
+        under WAL except for the last commits on power loss, and bulk imports
+        may drop to OFF.
+        """
+        if synchronous.upper() not in SYNCHRONOUS_MODES:
+            raise ValueError(f"synchronous must be one of {', '.join(SYNCHRONOUS_MODES)}.")
         self.db_path = Path(db_path or DEFAULT_DB_PATH)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._synchronous = synchronous.upper()
+        # One writer connection, serialised by _lock; reads go through a
+        # per-thread connection (see _reader) and never take the lock.
         self._lock = threading.Lock()
-        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        self._conn.row_factory = sqlite3.Row
-        with self._conn:
-            self._conn.execute("PRAGMA foreign_keys = ON;")
+        self._local = threading.local()
+        self._readers: Set[sqlite3.Connection] = set()
+        self._readers_lock = threading.Lock()
+        self._conn = self._connect()
+        # WAL lets readers proceed during a write and replaces the per-commit
+        # rollback-journal fsync with an append to the log.
+        self._conn.execute("PRAGMA journal_mode = WAL;")
         self._ensure_schema()
 
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA synchronous = {self._synchronous};")
+        conn.execute("PRAGMA temp_store = MEMORY;")
+        conn.execute("PRAGMA cache_size = -64000;")
+        conn.execute("PRAGMA mmap_size = 268435456;")
+        conn.execute("PRAGMA busy_timeout = 5000;")
+        with conn:
+            conn.execute("PRAGMA foreign_keys = ON;")
+        return conn
+
+    def _reader(self) -> sqlite3.Connection:
+        """Return the calling thread's read-only connection, opening it on first use."""
+        holder = getattr(self._local, "holder", None)
+        if holder is None:
+            conn = self._connect()
+            conn.execute("PRAGMA query_only = ON;")
+            holder = _ReaderHolder(conn)
+            with self._readers_lock:
+                self._readers.add(conn)
+            # The thread-local holder is dropped when its thread exits; close
+            # the connection then rather than keeping it until close().
+            weakref.finalize(holder, _release_reader, self._readers, self._readers_lock, conn)
+            self._local.holder = holder
+        return holder.conn
+
     # --------------------------------------------------------------------- #
     # Schema
     # --------------------------------------------------------------------- #
@@ -109,6 +240,48 @@ class InventoryStore:
                 ON books(authors COLLATE NOCASE);
                 """
             )
+            self._conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_shelves_name
+                ON shelves(name COLLATE NOCASE);
+                """
+            )
+            # UNIQUE(shelf_row_id, slot_index) already indexes the row lookup;
+            # carrying book_id as well lets row listings skip the table.
+            self._conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_placements_row_slot
+                ON placements(shelf_row_id, slot_index, book_id);
+                """
+            )
+            self._conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_books_openlibrary_key
+                ON books(openlibrary_key) WHERE openlibrary_key IS NOT NULL;
+                """
+            )
+            self._conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_books_isbn
+                ON books(isbn) WHERE isbn IS NOT NULL;
+                """
+            )
+            self._fts_enabled = self._ensure_fts()
+
+    def _ensure_fts(self) -> bool:
+        """Create the full-text index, filling it on first use. False without FTS5."""
+        exists = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'books_fts';"
+        ).fetchone()
+        try:
+            for statement in _FTS_SCHEMA:
+                self._conn.execute(statement)
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5: list_books keeps using LIKE.
+            return False
+        if not exists:
+            self._conn.execute("INSERT INTO books_fts (books_fts) VALUES ('rebuild');")
+        return True
 
     def _ensure_books_supports_copies(self) -> None:
         """Ensure the books table permits duplicate metadata for multiple copies."""
@@ -225,7 +398,10 @@ class InventoryStore:
     # Utility helpers
     # --------------------------------------------------------------------- #
     def close(self) -> None:
-        with self._lock:
+        with self._lock, self._readers_lock:
+            for reader in self._readers:
+                reader.close()
+            self._readers.clear()
             self._conn.close()
 
     # --------------------------------------------------------------------- #
@@ -241,35 +417,25 @@ class InventoryStore:
         """Insert a new book or update an existing one. Returns (book_id, created)."""
 
         def _insert() -> Tuple[int, bool]:
-            columns = DEFAULT_COLUMNS + ["cover_path"]
             values = [record.get(column) for column in DEFAULT_COLUMNS]
             values.append(str(cover_path) if cover_path else None)
-            placeholders = ", ".join("?" for _ in columns)
-            self._conn.execute(
-                f"""
-                INSERT INTO books ({", ".join(columns)})
-                VALUES ({placeholders})
-                """,
-                values,
-            )
-            book_id = self._conn.execute("SELECT last_insert_rowid()").fetchone()[0]
-            return int(book_id), True
+            cursor = self._conn.execute(_BOOK_INSERT, values)
+            return int(cursor.lastrowid), True
 
         with self._lock, self._conn:
             if allow_multiple:
                 return _insert()
 
-            existing = None
-            if record.get("openlibrary_key"):
-                existing = self._conn.execute(
-                    "SELECT * FROM books WHERE openlibrary_key = ?",
-                    (record["openlibrary_key"],),
-                ).fetchone()
-            if existing is None and record.get("isbn"):
-                existing = self._conn.execute(
-                    "SELECT * FROM books WHERE isbn = ?",
-                    (record["isbn"],),
-                ).fetchone()
+            # A match on the Open Library key wins over one on ISBN.
+            existing = self._conn.execute(
+                """
+                SELECT * FROM books
+                WHERE openlibrary_key = ?1 OR isbn = ?2
+                ORDER BY COALESCE(openlibrary_key = ?1, 0) DESC, id
+                LIMIT 1;
+                """,
+                (record.get("openlibrary_key") or None, record.get("isbn") or None),
+            ).fetchone()
 
             if existing:
                 book_id = existing["id"]
@@ -309,21 +475,17 @@ class InventoryStore:
             )
 
     def list_books(self, search: str = "") -> List[Dict[str, Any]]:
-        sql = """
-            SELECT
-                b.*,
-                p.shelf_row_id,
-                p.slot_index,
-                sr.name AS row_name,
-                sr.position AS row_position,
-                sr.capacity AS row_capacity,
-                s.id AS shelf_id,
-                s.name AS shelf_name
-            FROM books b
-            LEFT JOIN placements p ON p.book_id = b.id
-            LEFT JOIN shelf_rows sr ON sr.id = p.shelf_row_id
-            LEFT JOIN shelves s ON s.id = sr.shelf_id
-        """
+        reader = self._reader()
+        tokens = _SEARCH_TOKEN_RE.findall(search) if self._fts_enabled else []
+        if tokens:
+            # Every word must prefix-match a word in title, authors, publisher or ISBN.
+            match = " ".join(f'"{token}"*' for token in tokens)
+            books = [dict(row) for row in reader.execute(_BOOK_FTS_SEARCH, (match,))]
+            if books:
+                return books
+            # No word-prefix hit: fall through to substring matching so partial
+            # words ("obbit") and ISBN fragments still find something.
+        sql = _BOOK_SELECT
         params: Tuple[Any, ...] = ()
         if search:
             search_like = f"%{search.lower()}%"
@@ -334,32 +496,12 @@ class InventoryStore:
                    OR lower(COALESCE(b.isbn, '')) LIKE ?
             """
             params = (search_like, search_like, search_like, search_like)
-        sql += " ORDER BY lower(b.title);"
-        with self._lock:
-            rows = self._conn.execute(sql, params).fetchall()
-        return [dict(row) for row in rows]
+        sql += " ORDER BY b.title COLLATE NOCASE;"
+        # Build the dicts straight off the cursor instead of via fetchall()'s row list.
+        return [dict(row) for row in reader.execute(sql, params)]
 
     def get_book(self, book_id: int) -> Optional[Dict[str, Any]]:
-        with self._lock:
-            row = self._conn.execute(
-                """
-                SELECT
-                    b.*,
-                    p.shelf_row_id,
-                    p.slot_index,
-                    sr.name AS row_name,
-                    sr.position AS row_position,
-                    sr.capacity AS row_capacity,
-                    s.id AS shelf_id,
-                    s.name AS shelf_name
-                FROM books b
-                LEFT JOIN placements p ON p.book_id = b.id
-                LEFT JOIN shelf_rows sr ON sr.id = p.shelf_row_id
-                LEFT JOIN shelves s ON s.id = sr.shelf_id
-                WHERE b.id = ?
-                """,
-                (book_id,),
-            ).fetchone()
+        row = self._reader().execute(_BOOK_BY_ID, (book_id,)).fetchone()
         return dict(row) if row else None
 
     def delete_book(self, book_id: int) -> None:
@@ -375,39 +517,34 @@ class InventoryStore:
             FROM books b
             LEFT JOIN placements p ON p.book_id = b.id
             WHERE p.id IS NULL
-            ORDER BY lower(b.title);
+            ORDER BY b.title COLLATE NOCASE;
         """
-        with self._lock:
-            rows = self._conn.execute(sql).fetchall()
-        return [dict(row) for row in rows]
+        return [dict(row) for row in self._reader().execute(sql)]
 
     # ------------------------------------------------------------------ #
     # Shelf management
     # ------------------------------------------------------------------ #
-    def list_shelves(self) -> List[Dict[str, Any]]:
-        with self._lock:
-            rows = self._conn.execute(
-                """
-                SELECT
-                    s.*,
-                    COUNT(sr.id) AS row_count,
-                    COALESCE(SUM(sr.capacity), 0) AS capacity
-                FROM shelves s
-                LEFT JOIN shelf_rows sr ON sr.shelf_id = s.id
-                GROUP BY s.id
-                ORDER BY lower(s.name);
-                """
-            ).fetchall()
-        return [dict(row) for row in rows]
+    def list_shelves(self) -> List[sqlite3.Row]:
+        return self._reader().execute(
+            """
+            SELECT
+                s.*,
+                COUNT(sr.id) AS row_count,
+                COALESCE(SUM(sr.capacity), 0) AS capacity
+            FROM shelves s
+            LEFT JOIN shelf_rows sr ON sr.shelf_id = s.id
+            GROUP BY s.id
+            ORDER BY s.name COLLATE NOCASE;
+            """
+        ).fetchall()
 
     def create_shelf(self, name: str, description: str = "") -> int:
         with self._lock, self._conn:
-            self._conn.execute(
+            cursor = self._conn.execute(
                 "INSERT INTO shelves (name, description) VALUES (?, ?);",
                 (name, description or None),
             )
-            shelf_id = self._conn.execute("SELECT last_insert_rowid()").fetchone()[0]
-        return int(shelf_id)
+        return int(cursor.lastrowid)
 
     def update_shelf(self, shelf_id: int, *, name: str, description: str) -> None:
         with self._lock, self._conn:
@@ -430,41 +567,37 @@ class InventoryStore:
             with self._conn:
                 self._conn.execute("DELETE FROM shelves WHERE id = ?;", (shelf_id,))
 
-    def list_rows(self, shelf_id: int) -> List[Dict[str, Any]]:
-        with self._lock:
-            rows = self._conn.execute(
-                """
-                SELECT
-                    sr.*,
-                    COUNT(p.id) AS used,
-                    COALESCE(MAX(p.slot_index), 0) AS max_slot
-                FROM shelf_rows sr
-                LEFT JOIN placements p ON p.shelf_row_id = sr.id
-                WHERE sr.shelf_id = ?
-                GROUP BY sr.id
-                ORDER BY sr.position;
-                """,
-                (shelf_id,),
-            ).fetchall()
-        return [dict(row) for row in rows]
-
-    def get_row(self, row_id: int) -> Optional[Dict[str, Any]]:
-        with self._lock:
-            row = self._conn.execute(
-                """
-                SELECT
-                    sr.*,
-                    COUNT(p.id) AS used,
-                    s.name AS shelf_name
-                FROM shelf_rows sr
-                LEFT JOIN shelves s ON s.id = sr.shelf_id
-                LEFT JOIN placements p ON p.shelf_row_id = sr.id
-                WHERE sr.id = ?
-                GROUP BY sr.id;
-                """,
-                (row_id,),
-            ).fetchone()
-        return dict(row) if row else None
+    def list_rows(self, shelf_id: int) -> List[sqlite3.Row]:
+        return self._reader().execute(
+            """
+            SELECT
+                sr.*,
+                COUNT(p.id) AS used,
+                COALESCE(MAX(p.slot_index), 0) AS max_slot
+            FROM shelf_rows sr
+            LEFT JOIN placements p ON p.shelf_row_id = sr.id
+            WHERE sr.shelf_id = ?
+            GROUP BY sr.id
+            ORDER BY sr.position;
+            """,
+            (shelf_id,),
+        ).fetchall()
+
+    def get_row(self, row_id: int) -> Optional[sqlite3.Row]:
+        return self._reader().execute(
+            """
+            SELECT
+                sr.*,
+                COUNT(p.id) AS used,
+                s.name AS shelf_name
+            FROM shelf_rows sr
+            LEFT JOIN shelves s ON s.id = sr.shelf_id
+            LEFT JOIN placements p ON p.shelf_row_id = sr.id
+            WHERE sr.id = ?
+            GROUP BY sr.id;
+            """,
+            (row_id,),
+        ).fetchone()
 
     def create_row(
         self,
@@ -480,15 +613,14 @@ class InventoryStore:
                     (shelf_id,),
                 ).fetchone()[0]
             )
-            self._conn.execute(
+            cursor = self._conn.execute(
                 """
                 INSERT INTO shelf_rows (shelf_id, name, position, capacity)
                 VALUES (?, ?, ?, ?);
                 """,
                 (shelf_id, name or None, next_position, capacity or 0),
             )
-            row_id = self._conn.execute("SELECT last_insert_rowid()").fetchone()[0]
-        return int(row_id)
+        return int(cursor.lastrowid)
 
     def update_row(
         self,
@@ -700,23 +832,22 @@ class InventoryStore:
             self._conn.execute("DELETE FROM placements WHERE book_id = ?;", (book_id,))
 
     def get_placement(self, book_id: int) -> Optional[PlacementInfo]:
-        with self._lock:
-            row = self._conn.execute(
-                """
-                SELECT
-                    p.book_id,
-                    sr.shelf_id,
-                    s.name AS shelf_name,
-                    p.shelf_row_id,
-                    COALESCE(sr.name, 'Row ' || sr.position) AS row_name,
-                    p.slot_index
-                FROM placements p
-                JOIN shelf_rows sr ON sr.id = p.shelf_row_id
-                JOIN shelves s ON s.id = sr.shelf_id
-                WHERE p.book_id = ?;
-                """,
-                (book_id,),
-            ).fetchone()
+        row = self._reader().execute(
+            """
+            SELECT
+                p.book_id,
+                sr.shelf_id,
+                s.name AS shelf_name,
+                p.shelf_row_id,
+                COALESCE(sr.name, 'Row ' || sr.position) AS row_name,
+                p.slot_index
+            FROM placements p
+            JOIN shelf_rows sr ON sr.id = p.shelf_row_id
+            JOIN shelves s ON s.id = sr.shelf_id
+            WHERE p.book_id = ?;
+            """,
+            (book_id,),
+        ).fetchone()
         if row is None:
             return None
         return PlacementInfo(
@@ -728,70 +859,93 @@ class InventoryStore:
             slot_index=row["slot_index"],
         )
 
-    def list_rows_with_shelves(self) -> List[Dict[str, Any]]:
-        with self._lock:
-            rows = self._conn.execute(
-                """
-                SELECT
-                    sr.*,
-                    s.name AS shelf_name,
-                    s.id AS shelf_id,
-                    COUNT(p.id) AS used,
-                    COALESCE(MAX(p.slot_index), 0) AS max_slot
-                FROM shelf_rows sr
-                JOIN shelves s ON s.id = sr.shelf_id
-                LEFT JOIN placements p ON p.shelf_row_id = sr.id
-                GROUP BY sr.id
-                ORDER BY lower(s.name), sr.position;
-                """
-            ).fetchall()
-        return [dict(row) for row in rows]
+    def list_rows_with_shelves(self) -> List[sqlite3.Row]:
+        return self._reader().execute(
+            """
+            SELECT
+                sr.*,
+                s.name AS shelf_name,
+                s.id AS shelf_id,
+                COUNT(p.id) AS used,
+                COALESCE(MAX(p.slot_index), 0) AS max_slot
+            FROM shelf_rows sr
+            JOIN shelves s ON s.id = sr.shelf_id
+            LEFT JOIN placements p ON p.shelf_row_id = sr.id
+            GROUP BY sr.id
+            ORDER BY s.name COLLATE NOCASE, sr.position;
+            """
+        ).fetchall()
 
     def get_shelf_structure(self) -> List[Dict[str, Any]]:
         """Return nested shelf -> rows -> placements for visualisation."""
+        records = self._reader().execute(
+            """
+            SELECT
+                s.id AS shelf_id,
+                s.name AS shelf_name,
+                s.description AS shelf_description,
+                sr.id AS row_id,
+                sr.name AS row_name,
+                sr.position AS row_position,
+                sr.capacity AS row_capacity,
+                p.slot_index,
+                b.id AS book_id,
+                b.title,
+                b.authors,
+                b.cover_path
+            FROM shelves s
+            LEFT JOIN shelf_rows sr ON sr.shelf_id = s.id
+            LEFT JOIN (placements p JOIN books b ON b.id = p.book_id)
+                ON p.shelf_row_id = sr.id
+            ORDER BY s.name COLLATE NOCASE, s.id, sr.position, p.slot_index;
+            """
+        ).fetchall()
+
         shelves = []
-        with self._lock:
-            shelf_rows = self._conn.execute(
-                "SELECT * FROM shelves ORDER BY lower(name);"
-            ).fetchall()
-            for shelf in shelf_rows:
-                rows = self._conn.execute(
-                    """
-                    SELECT *
-                    FROM shelf_rows
-                    WHERE shelf_id = ?
-                    ORDER BY position;
-                    """,
-                    (shelf["id"],),
-                ).fetchall()
-                row_entries = []
-                for row in rows:
-                    placements = self._conn.execute(
-                        """
-                        SELECT
-                            p.slot_index,
-                            b.id AS book_id,
-                            b.title,
-                            b.authors,
-                            b.cover_path
-                        FROM placements p
-                        JOIN books b ON b.id = p.book_id
-                        WHERE p.shelf_row_id = ?
-                        ORDER BY p.slot_index;
-                        """,
-                        (row["id"],),
-                    ).fetchall()
-                    row_entries.append(
-                        {
-                            "row": dict(row),
-                            "placements": [dict(p) for p in placements],
-                        }
-                    )
-                shelves.append({"shelf": dict(shelf), "rows": row_entries})
+        for shelf_id, shelf_records in groupby(records, key=itemgetter("shelf_id")):
+            first = next(shelf_records)
+            shelf_entry = {
+                "shelf": {
+                    "id": shelf_id,
+                    "name": first["shelf_name"],
+                    "description": first["shelf_description"],
+                },
+                "rows": [],
+            }
+            shelves.append(shelf_entry)
+            for row_id, row_records in groupby(chain([first], shelf_records), key=itemgetter("row_id")):
+                if row_id is None:
+                    continue  # Shelf without rows.
+                row_records = list(row_records)
+                head = row_records[0]
+                shelf_entry["rows"].append(
+                    {
+                        "row": {
+                            "id": row_id,
+                            "shelf_id": shelf_id,
+                            "name": head["row_name"],
+                            "position": head["row_position"],
+                            "capacity": head["row_capacity"],
+                        },
+                        "placements": [
+                            {
+                                "slot_index": record["slot_index"],
+                                "book_id": record["book_id"],
+                                "title": record["title"],
+                                "authors": record["authors"],
+                                "cover_path": record["cover_path"],
+                            }
+                            for record in row_records
+                            if record["book_id"] is not None
+                        ],
+                    }
+                )
         return shelves
 
     def reorder_row(self, row_id: int, book_ids: List[int]) -> None:
         with self._lock, self._conn:
+            # Take the write lock up front rather than upgrading a deferred transaction.
+            self._conn.execute("BEGIN IMMEDIATE;")
             # Shift current slot indices out of the way to avoid transient UNIQUE conflicts
             self._conn.execute(
                 """
@@ -818,17 +972,16 @@ class InventoryStore:
                     (row_id,),
                 )
 
-            for index, book_id in enumerate(book_ids, start=1):
-                self._conn.execute(
-                    """
-                    INSERT INTO placements (book_id, shelf_row_id, slot_index)
-                    VALUES (?, ?, ?)
-                    ON CONFLICT(book_id) DO UPDATE SET
-                        shelf_row_id = excluded.shelf_row_id,
-                        slot_index = excluded.slot_index;
-                    """,
-                    (book_id, row_id, index),
-                )
+            self._conn.executemany(
+                """
+                INSERT INTO placements (book_id, shelf_row_id, slot_index)
+                VALUES (?, ?, ?)
+                ON CONFLICT(book_id) DO UPDATE SET
+                    shelf_row_id = excluded.shelf_row_id,
+                    slot_index = excluded.slot_index;
+                """,
+                [(book_id, row_id, index) for index, book_id in enumerate(book_ids, start=1)],
+            )
 
             # Reset any remaining temp slot indices (> 1000) that may linger if the list was shortened
             self._conn.execute(
@@ -2,12 +2,17 @@ from __future__ import annotations
 
 import hashlib
 import io
+import os
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 
 import requests
 from PIL import Image, ImageTk, UnidentifiedImageError
 
+from api import get_session
+
 APP_DIR = Path.home() / ".moms_books"
 COVERS_DIR = APP_DIR / "covers"
 COVERS_DIR.mkdir(parents=True, exist_ok=True)
@@ -40,41 +45,84 @@ def fetch_and_cache_cover(
     if target_path.exists():
         return target_path
 
+    # Write next to the target and rename into place, so a failed or
+    # concurrent download never leaves a truncated file that exists() trusts.
+    partial_path = target_path.with_name(f"{target_path.stem}.{threading.get_ident()}.part")
     try:
-        response = requests.get(cover_url, timeout=15)
-        response.raise_for_status()
-    except Exception:
+        with get_session().get(cover_url, timeout=15, stream=True) as response:
+            response.raise_for_status()
+            if max_edge:
+                payload = response.content
+            else:
+                with open(partial_path, "wb") as handle:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        handle.write(chunk)
+                payload = None
+    except (requests.RequestException, OSError):
+        partial_path.unlink(missing_ok=True)
         return None
 
-    if max_edge:
+    if payload is not None:
         try:
-            image = Image.open(io.BytesIO(response.content))
+            image = Image.open(io.BytesIO(payload))
             image.thumbnail((max_edge, max_edge), Image.LANCZOS)
-            image.save(target_path)
+            image.save(partial_path, format="JPEG")
         except (UnidentifiedImageError, OSError):
             try:
-                with open(target_path, "wb") as handle:
-                    handle.write(response.content)
+                with open(partial_path, "wb") as handle:
+                    handle.write(payload)
             except OSError:
+                partial_path.unlink(missing_ok=True)
                 return None
-    else:
-        try:
-            with open(target_path, "wb") as handle:
-                handle.write(response.content)
-        except OSError:
-            return None
 
+    try:
+        os.replace(partial_path, target_path)
+    except OSError:
+        partial_path.unlink(missing_ok=True)
+        return None
     return target_path
 
 
 def load_thumbnail(path: Path, size: Tuple[int, int]) -> Optional[ImageTk.PhotoImage]:
     """Return a resized PhotoImage for Tkinter."""
-    if not path.exists():
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
         return None
+    # Keyed on mtime so a cover rewritten by fetch_and_cache_cover is decoded again.
+    return _cached_thumbnail(str(path), mtime_ns, tuple(size))
+
+
+@lru_cache(maxsize=256)
+def _cached_thumbnail(
+    path: str, mtime_ns: int, size: Tuple[int, int]
+) -> Optional[ImageTk.PhotoImage]:
     try:
         image = Image.open(path)
+        image.thumbnail(size, Image.LANCZOS)
     except (UnidentifiedImageError, OSError):
         return None
-    image.thumbnail(size, Image.LANCZOS)
     return ImageTk.PhotoImage(image)
 
+
+def load_thumbnails(path: Path, sizes: Sequence[Tuple[int, int]]) -> Optional[List[Image.Image]]:
+    """Decode a cached cover once and return a resized copy for each size.
+
+    Unlike ``load_thumbnail`` this does no Tk work, so it is safe to call from
+    a worker thread; wrap the results in ``ImageTk.PhotoImage`` on the UI thread.
+    """
+    try:
+        with Image.open(path) as source:
+            # Copies of a loaded image cannot use libjpeg's DCT scaling the way
+            # thumbnail() on a fresh file does, so ask for it up front: decode
+            # at the smallest 1/2, 1/4 or 1/8 scale still covering every size.
+            source.draft("RGB", (max(w for w, _ in sizes), max(h for _, h in sizes)))
+            source.load()
+            thumbnails = []
+            for size in sizes:
+                thumbnail = source.copy()
+                thumbnail.thumbnail(size, Image.LANCZOS)
+                thumbnails.append(thumbnail)
+    except (UnidentifiedImageError, OSError):
+        return None
+    return thumbnails
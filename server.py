@@ -1,15 +1,24 @@
 from __future__ import annotations
 
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
 
 from fastapi import Body, Depends, FastAPI, HTTPException, Query, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
 from pydantic import BaseModel, Field
 
-from api import COVER_URL_TEMPLATE, OpenLibraryQuery, build_record, fetch_records
+from api import (
+    COVER_URL_TEMPLATE,
+    OpenLibraryQuery,
+    SearchCacheKey,
+    build_record,
+    fetch_records,
+    is_search_cached,
+)
 from inventory import InventoryStore
 from media import COVERS_DIR, fetch_and_cache_cover
 from enrichment import get_enriched_record
@@ -30,6 +39,30 @@ app.add_middleware(
 )
 
 
+# Warms the search cache with the next page while the user reads this one.
+_prefetch_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+_prefetch_inflight: Set[SearchCacheKey] = set()
+_prefetch_lock = threading.Lock()
+
+
+def _prefetch_page(query: OpenLibraryQuery, offset: int) -> None:
+    """Queue a background fetch of one page unless it is cached or already queued."""
+    key = query.cache_key(offset)
+    with _prefetch_lock:
+        if key in _prefetch_inflight or is_search_cached(query, offset):
+            return
+        _prefetch_inflight.add(key)
+
+    def _run() -> None:
+        try:
+            fetch_records(query, offset)
+        finally:
+            with _prefetch_lock:
+                _prefetch_inflight.discard(key)
+
+    _prefetch_pool.submit(_run)
+
+
 def get_store() -> InventoryStore:
     if not hasattr(get_store, "_instance"):
         get_store._instance = InventoryStore()
@@ -38,6 +71,7 @@ def get_store() -> InventoryStore:
 
 @app.on_event("shutdown")
 def _shutdown() -> None:
+    _prefetch_pool.shutdown(wait=False, cancel_futures=True)
     store = getattr(get_store, "_instance", None)
     if isinstance(store, InventoryStore):
         store.close()
@@ -120,10 +154,11 @@ def _cover_asset(value: Any) -> Optional[str]:
     return f"/api/covers/{filename}"
 
 
-def _normalize_record(record: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+def _normalize_record(record: Optional[Mapping[str, Any]]) -> Dict[str, Any]:
+    """Copy a dict or sqlite3.Row into a JSON-ready dict."""
     if not record:
         return {}
-    normalized = {key: _serialize(value) for key, value in record.items()}
+    normalized = {key: _serialize(record[key]) for key in record.keys()}
     normalized["cover_asset"] = _cover_asset(normalized.get("cover_path"))
     return normalized
 
@@ -236,7 +271,10 @@ def search_books(
         year=year,
         limit=page_size,
     )
-    results, total = fetch_records(query, offset=(page - 1) * page_size)
+    offset = (page - 1) * page_size
+    results, total = fetch_records(query, offset=offset)
+    if offset + page_size < total:
+        _prefetch_page(query, offset + page_size)
     return SearchResponse(results=results, total=total, page=page, page_size=page_size)
 
 
@@ -3,10 +3,44 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 root_str = str(ROOT)
 if root_str not in sys.path:
     sys.path.insert(0, root_str)
 
+import enrichment  # noqa: E402  (needs the repo root on sys.path)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_enrichment_cache(tmp_path_factory: pytest.TempPathFactory):
+    # Keep test runs out of the developer's real ~/.moms_books cache.
+    original = enrichment.ENRICHMENT_CACHE_DIR
+    enrichment.set_enrichment_cache_dir(tmp_path_factory.mktemp("enrichment_cache"))
+    yield
+    enrichment.set_enrichment_cache_dir(original)
+
+
+@pytest.fixture
+def make_book():
+    """Return a factory for storage-ready book records with blank defaults."""
 
+    def _make_book(title: str, **fields: object) -> dict[str, object]:
+        record: dict[str, object] = {
+            "title": title,
+            "subtitle": "",
+            "authors": "",
+            "first_publish_year": None,
+            "edition_count": None,
+            "openlibrary_key": None,
+            "cover_url": None,
+            "isbn": None,
+            "subjects": "",
+            "publisher": "",
+            "number_of_pages_median": None,
+        }
+        record.update(fields)
+        return record
 
+    return _make_book
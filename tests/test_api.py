@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import api
+from api import OpenLibraryQuery, build_record, rank_docs
+
+
+def _doc(title: str, authors: list[str], **extra: object) -> dict[str, object]:
+    doc: dict[str, object] = {"title": title, "author_name": authors}
+    doc.update(extra)
+    return doc
+
+
+def test_rank_docs_prefers_closest_title_and_author() -> None:
+    docs = [
+        _doc("A Tale of Two Cities", ["Charles Dickens"]),
+        _doc("The Hobbit", ["J.R.R. Tolkien"]),
+        _doc("The Hobbit: Graphic Novel", ["Chuck Dixon", "J.R.R. Tolkien"]),
+    ]
+    query = OpenLibraryQuery(title="The Hobbit", author="Tolkien")
+
+    ranked = rank_docs(query, docs)
+
+    assert [doc["title"] for doc in ranked] == [
+        "The Hobbit",
+        "The Hobbit: Graphic Novel",
+        "A Tale of Two Cities",
+    ]
+
+
+def test_rank_docs_keeps_original_order_for_ties() -> None:
+    docs = [_doc(f"Book {index}", []) for index in range(4)]
+
+    ranked = rank_docs(OpenLibraryQuery(general="nothing matches"), docs)
+
+    assert ranked == docs
+
+
+def test_rank_docs_rewards_year_and_editions() -> None:
+    docs = [
+        _doc("Dune", ["Frank Herbert"], first_publish_year=1984, edition_count=1),
+        _doc("Dune", ["Frank Herbert"], first_publish_year=1965, edition_count=12),
+    ]
+    query = OpenLibraryQuery(title="Dune", year=1965)
+
+    ranked = rank_docs(query, docs)
+
+    assert ranked[0]["first_publish_year"] == 1965
+
+
+def test_fetch_records_reuses_cached_page(monkeypatch) -> None:
+    calls: list[int] = []
+
+    def fake_fetch(query: OpenLibraryQuery, offset: int):
+        calls.append(offset)
+        return [{"title": "Cached", "key": f"/works/{offset}"}], 1
+
+    monkeypatch.setattr(api, "_fetch_uncached", fake_fetch)
+    monkeypatch.setattr(api, "_search_cache", api.OrderedDict())
+    query = OpenLibraryQuery(title="Cached")
+
+    first, _ = api.fetch_records(query, offset=5)
+    first[0]["title"] = "Mutated by caller"
+    second, total = api.fetch_records(OpenLibraryQuery(title="Cached"), offset=5)
+
+    assert calls == [5]
+    assert total == 1
+    assert second[0]["title"] == "Cached"
+
+
+def test_build_record_takes_first_isbn_and_publisher() -> None:
+    record = build_record(
+        {
+            "title": "Emma",
+            "author_name": ["Jane Austen"],
+            "isbn": ["9780141439587", "0141439580"],
+            "publisher": "Penguin",
+            "cover_i": 42,
+        }
+    )
+
+    assert record["isbn"] == "9780141439587"
+    assert record["publisher"] == "Penguin"
+    assert record["authors"] == "Jane Austen"
+    assert record["cover_url"].endswith("/42-L.jpg")
+    assert build_record({})["isbn"] == ""
+
+
+def test_server_prefetch_skips_pages_in_flight_or_cached(monkeypatch) -> None:
+    import threading
+
+    import server
+
+    calls: list[int] = []
+    release = threading.Event()
+
+    def fake_fetch(query: OpenLibraryQuery, offset: int):
+        calls.append(offset)
+        release.wait(timeout=5)
+        return [{"title": "Next", "key": f"/works/{offset}"}], 30
+
+    monkeypatch.setattr(api, "_fetch_uncached", fake_fetch)
+    monkeypatch.setattr(api, "_search_cache", api.OrderedDict())
+    pool = server.ThreadPoolExecutor(max_workers=1)
+    submitted: list[object] = []
+
+    def submit(fn, *args):
+        submitted.append(fn)
+        return pool.submit(fn, *args)
+
+    monkeypatch.setattr(server._prefetch_pool, "submit", submit)
+    query = OpenLibraryQuery(title="Prefetch", limit=10)
+
+    server._prefetch_page(query, 10)
+    server._prefetch_page(query, 10)  # still in flight
+    release.set()
+    pool.submit(lambda: None).result(timeout=5)
+    server._prefetch_page(query, 10)  # now cached
+    pool.shutdown(wait=True)
+
+    assert len(submitted) == 1
+    assert calls == [10]
+    assert not server._prefetch_inflight
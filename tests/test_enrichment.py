@@ -1,8 +1,16 @@
 from __future__ import annotations
 
 import unittest
+from unittest import mock
 
-from enrichment import NormalizedBook, cluster_records, merge_books
+import enrichment
+from enrichment import (
+    NormalizedBook,
+    cluster_records,
+    collect_enrichment,
+    get_enriched_record,
+    merge_books,
+)
 
 
 class EnrichmentMergeTests(unittest.TestCase):
@@ -154,6 +162,124 @@ class EnrichmentMergeTests(unittest.TestCase):
         combined_cluster = next(group for group in clusters if len(group) == 3)
         self.assertEqual({record.source for record in combined_cluster}, {"openlibrary", "loc", "ia"})
 
+    def test_cluster_links_transitively_in_first_record_order(self) -> None:
+        def book(source: str, title: str, isbns: set[str]) -> NormalizedBook:
+            return NormalizedBook(
+                source=source,
+                title=title,
+                authors=[],
+                publisher=None,
+                year=None,
+                isbn_set=isbns,
+                cover_url=None,
+                description=None,
+                subjects=[],
+                openlibrary_key=None,
+                raw={},
+            )
+
+        alone = book("ia", "Delta", set())
+        gamma = book("google", "Gamma", {"222"})
+        alpha = book("openlibrary", "Alpha", {"111"})
+        # Shares one ISBN with each side, so Alpha and Gamma join through it.
+        bridge = book("loc", "Beta", {"111", "222"})
+        last = book("loc", "Epsilon", {"333"})
+
+        clusters = cluster_records([alone, gamma, alpha, bridge, last])
+
+        self.assertEqual(
+            [[record.title for record in group] for group in clusters],
+            [["Delta"], ["Gamma", "Alpha", "Beta"], ["Epsilon"]],
+        )
+
+    def test_complete_record_skips_remote_sources(self) -> None:
+        record = {
+            "title": "The Hobbit",
+            "authors": "J. R. R. Tolkien",
+            "first_publish_year": 1937,
+            "openlibrary_key": "/works/OL262758W",
+            "cover_url": "https://covers.openlibrary.org/b/id/1-L.jpg",
+            "isbn": "9780345339683",
+            "subjects": "Fantasy, Middle Earth",
+            "publisher": "Ballantine",
+            "description": "Bilbo goes there and back again.",
+        }
+        with mock.patch("enrichment.fetch_loc_books") as loc, mock.patch(
+            "enrichment.fetch_ia_books"
+        ) as ia, mock.patch("enrichment.fetch_google_books") as google:
+            enriched = collect_enrichment(record)
+        loc.assert_not_called()
+        ia.assert_not_called()
+        google.assert_not_called()
+        self.assertEqual(enriched.subjects, ["Fantasy", "Middle Earth"])
+        self.assertEqual(enriched.description, "Bilbo goes there and back again.")
+
+    def test_stored_record_without_description_still_gets_one(self) -> None:
+        # Stored rows have no description column, so remote sources must run.
+        record = {
+            "title": "The Hobbit",
+            "authors": "J. R. R. Tolkien",
+            "first_publish_year": 1937,
+            "openlibrary_key": "/works/OL262758W",
+            "cover_url": "https://covers.openlibrary.org/b/id/1-L.jpg",
+            "isbn": "9780345339683",
+            "subjects": "Fantasy, Middle Earth",
+            "publisher": "Ballantine",
+        }
+        google_match = NormalizedBook(
+            source="google",
+            title="The Hobbit",
+            authors=["J. R. R. Tolkien"],
+            publisher="Ballantine",
+            year=1937,
+            isbn_set={"9780345339683"},
+            cover_url=None,
+            description="Bilbo goes there and back again.",
+            subjects=[],
+            openlibrary_key=None,
+            raw={},
+        )
+        with mock.patch("enrichment.fetch_loc_books", return_value=[]), mock.patch(
+            "enrichment.fetch_ia_books", return_value=[]
+        ), mock.patch("enrichment.fetch_google_books", return_value=[google_match]) as google:
+            enriched = collect_enrichment(record)
+        google.assert_called_once()
+        self.assertEqual(enriched.description, "Bilbo goes there and back again.")
+
+
+    @unittest.skipIf(enrichment.diskcache is None, "diskcache not installed")
+    def test_disk_cache_only_keeps_results_a_source_answered(self) -> None:
+        record = {"title": "Offline Book", "openlibrary_key": "/works/OL9W", "isbn": "9780000000001"}
+        match = NormalizedBook(
+            source="google",
+            title="Offline Book",
+            authors=[],
+            publisher="Pub",
+            year=2001,
+            isbn_set={"9780000000001"},
+            cover_url=None,
+            description="Found once the network is back.",
+            subjects=[],
+            openlibrary_key=None,
+            raw={},
+        )
+        key = (enrichment._DISK_CACHE_VERSION, ("ol", "/works/OL9W"))
+        disk = enrichment._get_disk_cache()
+
+        with mock.patch("enrichment.fetch_loc_books", return_value=[]), mock.patch(
+            "enrichment.fetch_ia_books", return_value=[]
+        ), mock.patch("enrichment.fetch_google_books", return_value=[]):
+            get_enriched_record(record)
+        self.assertIsNone(disk.get(key))
+
+        enrichment._enrichment_cache.clear()
+        with mock.patch("enrichment.fetch_loc_books", return_value=[]), mock.patch(
+            "enrichment.fetch_ia_books", return_value=[]
+        ), mock.patch("enrichment.fetch_google_books", return_value=[match]):
+            enriched = get_enriched_record(record)
+        self.assertEqual(enriched.description, "Found once the network is back.")
+        self.assertEqual(disk.get(key).description, "Found once the network is back.")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from inventory import InventoryStore
+
+
+def test_upsert_prefers_openlibrary_key_over_isbn(tmp_path: Path, make_book) -> None:
+    store = InventoryStore(db_path=tmp_path / "library.db")
+    # The ISBN match is the older row, so an id-ordered lookup would pick it.
+    isbn_id, _ = store.add_or_update_book(make_book("Paperback", openlibrary_key="/works/OL1W", isbn="111"))
+    key_id, _ = store.add_or_update_book(make_book("Hardback", openlibrary_key="/works/OL2W", isbn="222"))
+
+    revised = make_book("Hardback, revised", openlibrary_key="/works/OL2W", isbn="111")
+    book_id, created = store.add_or_update_book(revised)
+    assert (book_id, created) == (key_id, False)
+    assert store.get_book(key_id)["title"] == "Hardback, revised"
+    assert store.get_book(isbn_id)["title"] == "Paperback"
+
+    # Without a known key the ISBN still finds the existing book.
+    book_id, created = store.add_or_update_book(make_book("Paperback, reissue", isbn="111"))
+    assert (book_id, created) == (isbn_id, False)
+    store.close()
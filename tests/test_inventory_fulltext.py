@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+from inventory import InventoryStore
+
+
+def _titles(store: InventoryStore, term: str) -> list[str]:
+    return [book["title"] for book in store.list_books(term)]
+
+
+def test_fts_index_follows_insert_update_and_delete(tmp_path: Path, make_book) -> None:
+    store = InventoryStore(db_path=tmp_path / "library.db")
+    hobbit_id, _ = store.add_or_update_book(
+        make_book("The Hobbit", authors="J. R. R. Tolkien"), allow_multiple=True
+    )
+    store.add_or_update_book(make_book("Émile", authors="Rousseau"), allow_multiple=True)
+
+    assert _titles(store, "tolk") == ["The Hobbit"]
+    assert _titles(store, "emile") == ["Émile"]
+
+    with store._conn:
+        store._conn.execute(
+            "UPDATE books SET title = ?, authors = ? WHERE id = ?",
+            ("The Silmarillion", "Christopher Tolkien", hobbit_id),
+        )
+    assert _titles(store, "silmar") == ["The Silmarillion"]
+    assert _titles(store, "hobbit") == []
+
+    store.delete_book(hobbit_id)
+    assert _titles(store, "tolkien") == []
+    store.close()
+
+
+def test_existing_library_is_indexed_when_fts_is_first_created(tmp_path: Path) -> None:
+    db_path = tmp_path / "library.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        """
+        CREATE TABLE books (
+            id INTEGER PRIMARY KEY,
+            title TEXT NOT NULL,
+            subtitle TEXT,
+            authors TEXT,
+            first_publish_year INTEGER,
+            edition_count INTEGER,
+            openlibrary_key TEXT,
+            cover_url TEXT,
+            cover_path TEXT,
+            isbn TEXT,
+            subjects TEXT,
+            publisher TEXT,
+            number_of_pages_median INTEGER,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        );
+        """
+    )
+    conn.execute("INSERT INTO books (title, authors) VALUES ('Dune', 'Frank Herbert');")
+    conn.commit()
+    conn.close()
+
+    store = InventoryStore(db_path=db_path)
+    assert _titles(store, "herb") == ["Dune"]
+    store.close()
+
+
+def test_substring_and_symbol_searches_fall_back_to_like(tmp_path: Path, make_book) -> None:
+    store = InventoryStore(db_path=tmp_path / "library.db")
+    store.add_or_update_book(make_book("The Hobbit", isbn="9780345339683"), allow_multiple=True)
+    store.add_or_update_book(make_book("C++ Primer", publisher="Addison-Wesley"), allow_multiple=True)
+
+    # Mid-word fragments have no word-prefix match, so substring search applies.
+    assert _titles(store, "obbit") == ["The Hobbit"]
+    assert _titles(store, "0345339") == ["The Hobbit"]
+    # No word characters at all: only the LIKE path can answer.
+    assert _titles(store, "++") == ["C++ Primer"]
+    assert _titles(store, "no such book") == []
+    store.close()
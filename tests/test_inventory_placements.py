@@ -1,24 +1,11 @@
 from __future__ import annotations
 
+import sqlite3
 from pathlib import Path
 
-from inventory import InventoryStore
-
+import pytest
 
-def _make_book(index: int) -> dict[str, object]:
-    return {
-        "title": f"Book {index}",
-        "subtitle": "",
-        "authors": f"Author {index}",
-        "first_publish_year": None,
-        "edition_count": None,
-        "openlibrary_key": f"/works/OL{index}",
-        "cover_url": None,
-        "isbn": None,
-        "subjects": "Test",
-        "publisher": "Test Pub",
-        "number_of_pages_median": None,
-    }
+from inventory import InventoryStore
 
 
 def _create_store(tmp_path: Path) -> InventoryStore:
@@ -28,14 +15,14 @@ def _create_store(tmp_path: Path) -> InventoryStore:
     return InventoryStore(db_path=db_path)
 
 
-def test_set_placement_inserts_into_middle(tmp_path: Path) -> None:
+def test_set_placement_inserts_into_middle(tmp_path: Path, make_book) -> None:
     store = _create_store(tmp_path)
     shelf_id = store.create_shelf("Shelf One")
     row_id = store.create_row(shelf_id, name="Row A")
 
     book_ids = []
     for idx in range(3):
-        book_id, created = store.add_or_update_book(_make_book(idx), allow_multiple=True)
+        book_id, created = store.add_or_update_book(make_book(f"Book {idx}"), allow_multiple=True)
         assert created
         book_ids.append(book_id)
 
@@ -49,14 +36,14 @@ def test_set_placement_inserts_into_middle(tmp_path: Path) -> None:
     store.close()
 
 
-def test_set_placement_moves_between_rows_and_reindexes(tmp_path: Path) -> None:
+def test_set_placement_moves_between_rows_and_reindexes(tmp_path: Path, make_book) -> None:
     store = _create_store(tmp_path)
     shelf_id = store.create_shelf("Shelf One")
     row_a = store.create_row(shelf_id, name="Row A")
     row_b = store.create_row(shelf_id, name="Row B")
 
-    first_id, _ = store.add_or_update_book(_make_book(10), allow_multiple=True)
-    second_id, _ = store.add_or_update_book(_make_book(11), allow_multiple=True)
+    first_id, _ = store.add_or_update_book(make_book("Book 10"), allow_multiple=True)
+    second_id, _ = store.add_or_update_book(make_book("Book 11"), allow_multiple=True)
 
     store.set_placement(first_id, row_a, 1)
     store.set_placement(second_id, row_a, 2)
@@ -74,3 +61,70 @@ def test_set_placement_moves_between_rows_and_reindexes(tmp_path: Path) -> None:
     assert [p["slot_index"] for p in placements_b] == [1]
     store.close()
 
+
+def test_shelf_structure_nests_rows_and_books_in_order(tmp_path: Path, make_book) -> None:
+    store = _create_store(tmp_path)
+    study = store.create_shelf("study")
+    store.create_shelf("Attic")  # no rows
+    top = store.create_row(study, name="Top")
+    store.create_row(study, name="Bottom")  # no books
+
+    first_id, _ = store.add_or_update_book(make_book("Book 20"), allow_multiple=True)
+    second_id, _ = store.add_or_update_book(make_book("Book 21"), allow_multiple=True)
+    store.set_placement(second_id, top, 1)
+    store.set_placement(first_id, top, 2)
+
+    structure = store.get_shelf_structure()
+    # Shelves sort case-insensitively by name.
+    assert [entry["shelf"]["name"] for entry in structure] == ["Attic", "study"]
+    assert structure[0]["rows"] == []
+
+    rows = structure[1]["rows"]
+    assert [row["row"]["name"] for row in rows] == ["Top", "Bottom"]
+    assert [row["row"]["position"] for row in rows] == [1, 2]
+    assert rows[0]["row"]["shelf_id"] == study
+    assert [p["book_id"] for p in rows[0]["placements"]] == [second_id, first_id]
+    assert [p["title"] for p in rows[0]["placements"]] == ["Book 21", "Book 20"]
+    assert rows[1]["placements"] == []
+    store.close()
+
+
+def test_reorder_row_assigns_slots_in_given_order(tmp_path: Path, make_book) -> None:
+    store = _create_store(tmp_path)
+    shelf_id = store.create_shelf("Shelf One")
+    row_id = store.create_row(shelf_id, name="Row A")
+    other_row = store.create_row(shelf_id, name="Row B")
+
+    book_ids = [store.add_or_update_book(make_book(f"Book {30 + idx}"), allow_multiple=True)[0] for idx in range(4)]
+    for slot, book_id in enumerate(book_ids[:3], start=1):
+        store.set_placement(book_id, row_id, slot)
+    store.set_placement(book_ids[3], other_row, 1)
+
+    # Drop the first book, reverse the rest and pull one over from Row B.
+    store.reorder_row(row_id, [book_ids[2], book_ids[3], book_ids[1]])
+
+    rows = store.get_shelf_structure()[0]["rows"]
+    placements = next(row for row in rows if row["row"]["id"] == row_id)["placements"]
+    assert [p["book_id"] for p in placements] == [book_ids[2], book_ids[3], book_ids[1]]
+    assert [p["slot_index"] for p in placements] == [1, 2, 3]
+    assert next(row for row in rows if row["row"]["id"] == other_row)["placements"] == []
+    assert store.get_placement(book_ids[0]) is None
+    store.close()
+
+
+def test_reorder_row_rolls_back_on_failure(tmp_path: Path, make_book) -> None:
+    store = _create_store(tmp_path)
+    shelf_id = store.create_shelf("Shelf One")
+    row_id = store.create_row(shelf_id, name="Row A")
+    book_ids = [store.add_or_update_book(make_book(f"Book {40 + idx}"), allow_multiple=True)[0] for idx in range(2)]
+    store.set_placement(book_ids[0], row_id, 1)
+    store.set_placement(book_ids[1], row_id, 2)
+
+    # An unknown book id fails the foreign key after the slots were shifted.
+    with pytest.raises(sqlite3.IntegrityError):
+        store.reorder_row(row_id, [book_ids[1], 9999, book_ids[0]])
+
+    placements = store.get_shelf_structure()[0]["rows"][0]["placements"]
+    assert [p["book_id"] for p in placements] == book_ids
+    assert [p["slot_index"] for p in placements] == [1, 2]
+    store.close()
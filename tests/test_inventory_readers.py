@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import gc
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+
+from inventory import InventoryStore
+
+
+def test_thread_reader_is_used_then_closed_when_thread_exits(tmp_path: Path) -> None:
+    store = InventoryStore(db_path=tmp_path / "library.db")
+    store.create_shelf("Study")
+    main_reader = store._reader()
+    seen: dict[str, object] = {}
+
+    def worker() -> None:
+        seen["shelves"] = [shelf["name"] for shelf in store.list_shelves()]
+        seen["reader"] = store._reader()
+        seen["registered"] = seen["reader"] in store._readers
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    gc.collect()
+
+    worker_reader = seen["reader"]
+    assert seen["shelves"] == ["Study"]
+    assert seen["registered"] is True
+    assert worker_reader is not main_reader
+    assert worker_reader not in store._readers
+    with pytest.raises(sqlite3.ProgrammingError):
+        worker_reader.execute("SELECT 1;")
+    # The calling thread's reader is untouched.
+    assert main_reader in store._readers
+    main_reader.execute("SELECT 1;")
+    store.close()
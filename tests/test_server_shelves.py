@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from inventory import InventoryStore
+from server import app, get_store
+
+
+def _reset_store_singleton() -> None:
+    if hasattr(get_store, "_instance"):
+        instance = getattr(get_store, "_instance")
+        if isinstance(instance, InventoryStore):
+            instance.close()
+        delattr(get_store, "_instance")
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> InventoryStore:
+    _reset_store_singleton()
+    test_store = InventoryStore(db_path=tmp_path / "library.db")
+    app.dependency_overrides[get_store] = lambda: test_store
+    yield test_store
+    test_store.close()
+    app.dependency_overrides.pop(get_store, None)
+    _reset_store_singleton()
+
+
+@pytest.fixture
+def client(store: InventoryStore) -> TestClient:
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def test_shelf_endpoints_return_json_records(client: TestClient, store: InventoryStore) -> None:
+    response = client.post("/api/shelves", json={"name": "Study", "description": "By the desk"})
+    assert response.status_code == 201
+    shelf = response.json()
+    assert shelf["name"] == "Study"
+    assert shelf["description"] == "By the desk"
+    assert shelf["row_count"] == 0
+
+    store.create_shelf("Attic")
+    response = client.get("/api/shelves")
+    assert response.status_code == 200
+    assert [item["name"] for item in response.json()] == ["Attic", "Study"]
+
+    response = client.put(f"/api/shelves/{shelf['id']}", json={"name": "Office"})
+    assert response.status_code == 200
+    assert response.json()["name"] == "Office"
+
+
+def test_row_endpoints_return_json_records(client: TestClient, store: InventoryStore) -> None:
+    shelf_id = store.create_shelf("Study")
+
+    response = client.post(f"/api/shelves/{shelf_id}/rows", json={"name": "Top", "capacity": 12})
+    assert response.status_code == 201
+    row = response.json()
+    assert row["name"] == "Top"
+    assert row["capacity"] == 12
+    assert row["used"] == 0
+
+    client.post(f"/api/shelves/{shelf_id}/rows", json={"name": "Bottom", "capacity": 8})
+    response = client.get(f"/api/shelves/{shelf_id}/rows")
+    assert response.status_code == 200
+    assert [(item["name"], item["position"]) for item in response.json()] == [("Top", 1), ("Bottom", 2)]
+
+    response = client.put(f"/api/rows/{row['id']}", json={"name": "Upper", "capacity": 20})
+    assert response.status_code == 200
+    assert response.json()["name"] == "Upper"
+    assert response.json()["capacity"] == 20
+
+    response = client.put("/api/rows/9999", json={"name": "Missing"})
+    assert response.status_code == 404